@@ -0,0 +1,196 @@
+"""Point d'entree du backend Flask Urban Data Explorer."""
+
+import hashlib
+
+import orjson
+from flask import Flask, request
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+
+from config import config
+
+
+class OrjsonProvider(JSONProvider):
+    """Serialisation JSON via orjson (encodeur C, pas de tri des cles)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Corps de la route d'index fige a l'import : le payload est constant.
+_INDEX_BODY = orjson.dumps({
+    'message': "API Urban Data Explorer - Paris",
+    'version': '1.0',
+    'endpoints': {
+        'arrondissements': '/api/arrondissements',
+        'arrondissement': '/api/arrondissement/<numero>',
+        'logements': '/api/logements/...',
+        'pollution': '/api/pollution/...',
+        'prix': '/api/prix/...',
+        'transport': '/api/transport/...',
+        'health': '/api/health',
+    },
+})
+
+# Cache partage par les controleurs (initialise dans create_app).
+cache = Cache()
+
+
+def create_app(config_name='development'):
+    """Fabrique l'application Flask.
+
+    Les controleurs, modeles et services (qui tirent pandas/numpy/numba)
+    sont importes ici et non en tete de module : un simple
+    `import app` reste bon marche et le cout n'est paye qu'a la
+    construction de l'application. Cela resout aussi l'import circulaire
+    controleurs <-> cache.
+    """
+    from flask_compress import Compress
+
+    from controllers.logement import logement_bp
+    from controllers.pollution import pollution_bp
+    from controllers.prix import prix_bp
+    from controllers.transport import transport_bp
+    from models.arrondissement import Arrondissement
+    from models.prix import PrixModel
+    from models.transport import TransportModel
+    from services.data_loader import (
+        DataLoader,
+        PRESERIALIZED,
+        initialize_data_loader,
+    )
+    from services.kernels import warm_kernels
+    from utils.cors import setup_cors
+    from utils.validators import is_valid_annee, is_valid_arr
+    from utils.error_handler import register_error_handlers
+    from utils.http_cache import register_response_cache
+    from utils.logger import setup_logging, register_request_logging
+    from views.response_formatter import (
+        format_response_plain as format_response,
+        format_response_cached_bytes,
+        format_error_plain as format_error,
+    )
+
+    app = Flask(__name__)
+    app.config.from_object(config[config_name])
+    app.json = OrjsonProvider(app)
+    app.json.sort_keys = False
+    app.url_map.strict_slashes = False
+
+    cache.init_app(app)
+    Compress(app)
+    setup_logging(app)
+    setup_cors(app)
+    register_request_logging(app)
+    register_error_handlers(app)
+    # Enregistre apres le logging : son after_request memorise le corps
+    # avant que make_conditional ne puisse le vider en 304.
+    register_response_cache(app)
+
+    @app.after_request
+    def ajouter_cache_http(response):
+        # Les GET sont des fonctions pures de donnees statiques : ETag +
+        # Cache-Control permettent au navigateur de revalider en 304 sans
+        # retelecharger le corps. Les reponses streamees sont laissees
+        # intactes (materialiser leur corps annulerait le streaming).
+        if (request.method == 'GET' and response.status_code == 200
+                and not response.is_streamed
+                and not response.direct_passthrough):
+            response.headers['Cache-Control'] = 'public, max-age=3600'
+            response.set_etag(hashlib.sha1(response.get_data()).hexdigest())
+            return response.make_conditional(request)
+        return response
+
+    app.register_blueprint(logement_bp, url_prefix='/api/logements')
+    app.register_blueprint(pollution_bp, url_prefix='/api/pollution')
+    app.register_blueprint(prix_bp, url_prefix='/api/prix')
+    app.register_blueprint(transport_bp, url_prefix='/api/transport')
+
+    # Chargement des donnees Gold ; on purge le cache de reponses pour ne pas
+    # servir des resultats issus d'un chargement precedent.
+    initialize_data_loader()
+    warm_kernels()
+    with app.app_context():
+        cache.clear()
+
+    # Balayage periodique du cache applicatif : borne la memoire meme si
+    # des cles sont ecrites puis jamais relues.
+    from services.cache import cache_service
+    cache_service.start_sweeper()
+
+    # Les stats ne changent qu'a un rechargement des donnees : les bytes de
+    # /api/health sont figes ici plutot que recalcules a chaque requete.
+    health_body = orjson.dumps({
+        'success': True,
+        'data': {'status': 'ok', 'donnees': DataLoader.get_stats_summary()},
+    })
+
+    @app.route('/')
+    def index():
+        return format_response_cached_bytes(_INDEX_BODY)
+
+    @app.route('/api/health')
+    def health():
+        return format_response_cached_bytes(health_body)
+
+    @app.route('/api/arrondissements')
+    def get_all_arrondissements():
+        # Corps pre-serialise au demarrage : les donnees Gold sont statiques.
+        return format_response_cached_bytes(PRESERIALIZED['arrondissements'])
+
+    @app.route('/api/arrondissement/<int:numero>')
+    def get_arrondissement(numero):
+        if not 1 <= numero <= 20:
+            return format_error(f"Arrondissement invalide : {numero}", 404)
+        data = DataLoader.get_arrondissement(numero)
+        if not data:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {numero}", 404)
+        return format_response(Arrondissement(numero, data).to_dict(include_all=True))
+
+    @app.route('/api/arrondissement/<int:numero>/bundle')
+    def get_arrondissement_bundle(numero):
+        # Regroupe prix, vente, tendance et transport en une seule reponse :
+        # le front n'a plus a payer quatre allers-retours HTTP pour une page.
+        if not is_valid_arr(numero):
+            return format_error(f"Arrondissement invalide : {numero}", 404)
+        annee = request.args.get('annee', 2024, type=int)
+        if not is_valid_annee(annee):
+            return format_error(f"Annee invalide : {annee}", 400)
+        arr = DataLoader.get_arrondissement_obj(numero)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {numero}", 404)
+        prix_m2 = arr.get_prix_m2_median(annee)
+        transport = arr.get_transport()
+        score = TransportModel.calculer_score_accessibilite(transport)
+        return format_response({
+            'arrondissement': numero,
+            'annee': annee,
+            'prix': {
+                'prix_m2_median': prix_m2,
+                'classification': (PrixModel.classifier_prix(prix_m2)
+                                   if prix_m2 is not None else None),
+            },
+            'vente': {
+                'prix_median': arr.get_prix_median(annee),
+                'nb_ventes': arr.get_nb_ventes(annee),
+            },
+            'tendance': arr.get_tendance_prix(),
+            'transport': {
+                **transport,
+                'score_accessibilite': score,
+                'accessibilite': TransportModel.classifier_accessibilite(score),
+            },
+        })
+
+    return app
+
+
+if __name__ == '__main__':
+    app = create_app()
+    # threaded=True : les requetes concurrentes se recouvrent pendant les
+    # I/O socket, meme en serveur de developpement.
+    app.run(host='0.0.0.0', port=5000, threaded=True)
@@ -0,0 +1,41 @@
+"""Configuration du backend Flask par environnement."""
+
+import os
+
+
+class Config:
+    """Configuration de base, commune a tous les environnements."""
+    DEBUG = False
+    TESTING = False
+    CACHE_TYPE = 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 300
+    # Compression des reponses JSON (gzip niveau 6 au-dela de 512 octets).
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_LEVEL = 6
+    COMPRESS_MIN_SIZE = 512
+
+
+class DevelopmentConfig(Config):
+    ENV_NAME = 'development'
+    DEBUG = True
+
+
+class ProductionConfig(Config):
+    ENV_NAME = 'production'
+    CACHE_TYPE = 'RedisCache'
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    CORS_ORIGINS = [o for o in os.environ.get('CORS_ORIGINS', '').split(',') if o]
+
+
+class TestingConfig(Config):
+    ENV_NAME = 'testing'
+    TESTING = True
+    CACHE_TYPE = 'NullCache'
+
+
+config = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+    'default': DevelopmentConfig,
+}
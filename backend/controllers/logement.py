@@ -0,0 +1,129 @@
+"""Endpoints /api/logements : typologies, repartitions et logements sociaux."""
+
+import logging
+
+from flask import Blueprint, Response, request, stream_with_context
+
+from app import cache
+from services.data_loader import DataLoader, PRESERIALIZED
+from utils.validators import (
+    ERR_ANNEE_INVALIDE,
+    is_valid_annee,
+    valider_arrondissement,
+)
+from views.response_formatter import (
+    format_response_plain as format_response,
+    format_response_cached_bytes,
+    format_error_plain as format_error,
+)
+
+logger = logging.getLogger(__name__)
+
+logement_bp = Blueprint('logement', __name__)
+
+
+@logement_bp.route('/sociaux/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_logements_sociaux(arrondissement):
+    """Logements sociaux d'un arrondissement (APUR 2023)."""
+    try:
+        arr = DataLoader.get_arrondissement_obj(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            **arr.get_logements_sociaux_apur(),
+        })
+    except Exception as e:
+        logger.error("Erreur dans get_logements_sociaux: %s", e)
+        return format_error("Erreur interne du serveur", 500)
+
+
+@logement_bp.route('/typologie/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_typologie(arrondissement):
+    """Repartition des ventes par type de local pour une annee."""
+    annee = request.args.get('annee', 2024, type=int)
+    if not is_valid_annee(annee):
+        return format_response_cached_bytes(ERR_ANNEE_INVALIDE, 400)
+    try:
+        arr = DataLoader.get_arrondissement_obj(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            **arr.get_repartition_types(annee),
+        })
+    except Exception as e:
+        logger.error("Erreur dans get_typologie: %s", e)
+        return format_error("Erreur interne du serveur", 500)
+
+
+@logement_bp.route('/pieces/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_repartition_pieces(arrondissement):
+    """Repartition des ventes d'appartements par typologie (T1-T5+)."""
+    annee = request.args.get('annee', 2024, type=int)
+    if not is_valid_annee(annee):
+        return format_response_cached_bytes(ERR_ANNEE_INVALIDE, 400)
+    try:
+        arr = DataLoader.get_arrondissement_obj(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            **arr.get_repartition_pieces(annee),
+        })
+    except Exception as e:
+        logger.error("Erreur dans get_repartition_pieces: %s", e)
+        return format_error("Erreur interne du serveur", 500)
+
+
+@logement_bp.route('/synthese/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_synthese_typologie(arrondissement):
+    """Synthese logement 2024 d'un arrondissement."""
+    try:
+        arr = DataLoader.get_arrondissement_obj(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            **arr.get_synthese_typologie_2024(),
+        })
+    except Exception as e:
+        logger.error("Erreur dans get_synthese_typologie: %s", e)
+        return format_error("Erreur interne du serveur", 500)
+
+
+@logement_bp.route('/tous')
+def get_tous_logements(arrondissement=None):
+    """Synthese logement de tous les arrondissements pour une annee.
+
+    Reponse servie en streaming : l'enveloppe et chaque arrondissement sont
+    des bytes pre-serialises au demarrage, le generateur ne fait qu'emettre.
+    Le client peut commencer a parser des le premier chunk et la memoire
+    serveur reste bornee a un enregistrement.
+    """
+    annee = request.args.get('annee', 2024, type=int)
+    corps = PRESERIALIZED.get(('logements_tous', annee))
+    if corps is None:
+        return format_response_cached_bytes(ERR_ANNEE_INVALIDE, 400)
+    prefixe, chunks = corps
+
+    def generer():
+        yield prefixe
+        for i, chunk in enumerate(chunks):
+            yield chunk if i == 0 else b',' + chunk
+        yield b']}}'
+
+    return Response(stream_with_context(generer()),
+                    mimetype='application/json')
@@ -0,0 +1,73 @@
+"""Endpoints /api/pollution : qualite de l'air par arrondissement."""
+
+import logging
+
+from flask import Blueprint, request
+
+from app import cache
+from services.data_loader import (
+    DataLoader,
+    POLLUANT_COL,
+    PRECOMPUTED_QUALITE_BUCKETS,
+    PRECOMPUTED_RANKINGS,
+    PRECOMPUTED_STATS,
+)
+from utils.validators import valider_arrondissement
+from views.response_formatter import (
+    format_response_plain as format_response,
+    format_error_plain as format_error,
+)
+
+logger = logging.getLogger(__name__)
+
+pollution_bp = Blueprint('pollution', __name__)
+
+
+@pollution_bp.route('/qualite/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_qualite_air(arrondissement):
+    """Qualite de l'air d'un arrondissement."""
+    try:
+        arr = DataLoader.get_arrondissement_obj(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            **arr.get_qualite_air(),
+        })
+    except Exception as e:
+        logger.error("Erreur dans get_qualite_air: %s", e)
+        return format_error("Erreur interne du serveur", 500)
+
+
+@pollution_bp.route('/polluant/<string:polluant>')
+@cache.cached(timeout=3600, query_string=True)
+def get_classement_polluant(polluant):
+    """Classement des arrondissements par concentration d'un polluant."""
+    if polluant not in POLLUANT_COL:
+        return format_error(f"Polluant invalide : {polluant}", 400)
+    ordre = request.args.get('ordre', 'desc')
+    if ordre not in ['asc', 'desc']:
+        return format_error(f"Ordre invalide : {ordre}", 400)
+    return format_response({
+        'polluant': polluant,
+        'unite': 'µg/m³',
+        'ordre': ordre,
+        'classement': PRECOMPUTED_RANKINGS[(polluant, ordre)],
+    })
+
+
+@pollution_bp.route('/statistiques')
+@cache.cached(timeout=3600, key_prefix='pollution_stats')
+def get_statistiques_pollution():
+    """Statistiques (moyenne, min, max) par polluant sur les 20 arrondissements."""
+    return format_response(PRECOMPUTED_STATS)
+
+
+@pollution_bp.route('/repartition')
+@cache.cached(timeout=3600, key_prefix='pollution_repartition')
+def get_repartition_qualite():
+    """Repartition des arrondissements par classe de qualite de l'air."""
+    return format_response(PRECOMPUTED_QUALITE_BUCKETS)
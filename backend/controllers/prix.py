@@ -0,0 +1,227 @@
+"""Endpoints /api/prix : prix immobiliers par arrondissement."""
+
+import logging
+import re
+
+import numpy as np
+from flask import Blueprint, request
+
+from app import cache
+from models.prix import PrixModel
+from services.calculator import Calculator
+import services.data_loader as data_loader
+from services.data_loader import DataLoader
+from utils.validators import (
+    ERR_ANNEE_INVALIDE,
+    VALID_TYPES_PRIX,
+    is_valid_annee,
+    valider_arrondissement,
+)
+from views.response_formatter import (
+    format_response_plain as format_response,
+    format_response_cached_bytes,
+    format_error,
+)
+from views.schemas import ComparaisonQuerySchema, ValidationError, charger
+
+logger = logging.getLogger(__name__)
+
+prix_bp = Blueprint('prix', __name__)
+
+ANNEES = list(range(2020, 2026))
+
+# Accesseur local : les instances sont deja memoisees par le DataLoader,
+# chaque handler se reduit donc a un lookup de dict.
+_get_arr = DataLoader.get_arrondissement_obj
+
+# Liste d'arrondissements "1,5,16" : format et bornes (1-20) valides en une
+# passe par le moteur C de re, sans try/except ValueError par element.
+_ARR_LIST_RE = re.compile(r'^\s*(?:[1-9]|1\d|20)(?:\s*,\s*(?:[1-9]|1\d|20))*\s*$')
+
+
+@prix_bp.route('/m2/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_prix_m2(arrondissement):
+    """Prix median au m² d'un arrondissement pour une annee."""
+    annee = request.args.get('annee', 2024, type=int)
+    if not is_valid_annee(annee):
+        return format_response_cached_bytes(ERR_ANNEE_INVALIDE, 400)
+    if annee == 2024:
+        # Annee par defaut des tableaux de bord : corps serialise une fois
+        # au demarrage, aucun encodage JSON sur ce chemin.
+        corps = data_loader.PRESERIALIZED.get(('prix_m2_2024', arrondissement))
+        if corps is not None:
+            return format_response_cached_bytes(corps)
+    try:
+        arr = _get_arr(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        prix_m2 = arr.get_prix_m2_median(annee)
+        if prix_m2 is None:
+            return format_error(
+                f"Pas de prix au m² pour l'arrondissement {arrondissement} en {annee}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            'annee': annee,
+            'prix_m2_median': prix_m2,
+            'classification': PrixModel.classifier_prix(prix_m2),
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans get_prix_m2: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@prix_bp.route('/vente/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_prix_vente(arrondissement):
+    """Prix de vente median et volume de ventes pour une annee."""
+    annee = request.args.get('annee', 2024, type=int)
+    if not is_valid_annee(annee):
+        return format_response_cached_bytes(ERR_ANNEE_INVALIDE, 400)
+    if annee == 2024:
+        corps = data_loader.PRESERIALIZED.get(('vente_2024', arrondissement))
+        if corps is not None:
+            return format_response_cached_bytes(corps)
+    try:
+        arr = _get_arr(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            'annee': annee,
+            'prix_median': arr.get_prix_median(annee),
+            'nb_ventes': arr.get_nb_ventes(annee),
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans get_prix_vente: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@prix_bp.route('/evolution/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_evolution_prix(arrondissement):
+    """Evolution des prix entre deux annees."""
+    annee_debut = request.args.get('annee_debut', 2020, type=int)
+    annee_fin = request.args.get('annee_fin', 2024, type=int)
+    type_prix = request.args.get('type', 'prix_m2')
+    if not is_valid_annee(annee_debut) or not is_valid_annee(annee_fin):
+        return format_error("Annees invalides", 400)
+    if annee_debut >= annee_fin:
+        return format_error("L'annee de debut doit preceder l'annee de fin", 400)
+    if type_prix not in VALID_TYPES_PRIX:
+        return format_error(f"Type de prix invalide : {type_prix}", 400)
+    try:
+        # Table precalculee au demarrage : un lookup remplace les deux
+        # lectures de median et le calcul d'evolution par requete.
+        entree = data_loader.EVOLUTION_TABLE.get(
+            (arrondissement, annee_debut, annee_fin, type_prix))
+        if entree is None:
+            return format_error("Donnees de prix incompletes pour ces annees", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            'type': type_prix,
+            'annee_debut': annee_debut,
+            'annee_fin': annee_fin,
+            **entree,
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans get_evolution_prix: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@prix_bp.route('/tendance/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_tendance(arrondissement):
+    """Tendance globale des prix d'un arrondissement."""
+    try:
+        arr = _get_arr(arrondissement)
+        if arr is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response({
+            'arrondissement': arrondissement,
+            **arr.get_tendance_prix(),
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans get_tendance: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@prix_bp.route('/historique/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_historique_prix(arrondissement):
+    """Historique annuel 2020-2025 des prix d'un arrondissement."""
+    type_prix = request.args.get('type', 'prix_m2')
+    if type_prix not in VALID_TYPES_PRIX:
+        return format_error(f"Type de prix invalide : {type_prix}", 400)
+    try:
+        # Lecture d'une ligne contigue de la matrice (20, 6) pre-materialisee
+        # plutot que six appels de getter par requete.
+        hist = (data_loader.HIST_M2 if type_prix == 'prix_m2'
+                else data_loader.HIST_PRIX)
+        valeurs = hist[arrondissement - 1]
+        historique = [
+            {'annee': annee, 'valeur': None if np.isnan(v) else int(v)}
+            for annee, v in zip(ANNEES, valeurs)
+        ]
+        return format_response({
+            'arrondissement': arrondissement,
+            'type': type_prix,
+            'historique': historique,
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans get_historique_prix: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@prix_bp.route('/comparaison')
+@cache.cached(timeout=3600, query_string=True)
+def comparer_arrondissements():
+    """Comparaison des prix de plusieurs arrondissements."""
+    try:
+        parametres = charger(ComparaisonQuerySchema, request.args)
+    except ValidationError as e:
+        return format_error("Parametres invalides", 400, details=e.messages)
+    arr_list_str = parametres.arrondissements
+    annee = parametres.annee
+    type_prix = parametres.type
+    if not _ARR_LIST_RE.match(arr_list_str):
+        return format_error(f"Liste d'arrondissements invalide : {arr_list_str}", 400)
+    # dict.fromkeys deduplique en preservant l'ordre de la requete.
+    arrondissements = list(dict.fromkeys(
+        map(int, arr_list_str.replace(' ', '').split(','))))
+    try:
+        # Indexation directe des matrices d'historique puis argsort NumPy :
+        # plus de lambda de comparaison ni de branche isinstance par element.
+        hist = (data_loader.HIST_M2 if type_prix == 'prix_m2'
+                else data_loader.HIST_PRIX)
+        lignes = hist[[numero - 1 for numero in arrondissements]]
+        vals = lignes[:, annee - 2020]
+        ordre = np.argsort(-np.nan_to_num(vals, nan=-np.inf), kind='stable')
+        # Statistiques de toutes les lignes en un lot : les reductions
+        # NumPy passent une fois sur la matrice (N, T) au lieu d'un appel
+        # scalaire par arrondissement.
+        statistiques = Calculator.calculer_statistiques_batch(lignes)
+        comparaison = []
+        for position, i in enumerate(ordre, start=1):
+            comparaison.append({
+                'arrondissement': arrondissements[i],
+                'valeur': None if np.isnan(vals[i]) else int(vals[i]),
+                'statistiques': statistiques[i],
+                'classement': position,
+            })
+        return format_response({
+            'annee': annee,
+            'type': type_prix,
+            'comparaison': comparaison,
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans comparer_arrondissements: {e}")
+        return format_error("Erreur interne du serveur", 500)
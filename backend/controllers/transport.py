@@ -0,0 +1,112 @@
+"""Endpoints /api/transport : desserte metro et RER par arrondissement."""
+
+import logging
+
+import numpy as np
+from flask import Blueprint, request
+
+from app import cache
+from models.transport import TransportModel
+import services.data_loader as data_loader
+from services.data_loader import (
+    CRITERES_TRANSPORT,
+    TRANSPORT_METRO_RESP,
+    TRANSPORT_RER_RESP,
+    DataLoader,
+)
+from utils.validators import valider_arrondissement
+from views.response_formatter import (
+    format_response_plain as format_response,
+    format_response_cached_bytes,
+    format_error_plain as format_error,
+)
+
+logger = logging.getLogger(__name__)
+
+transport_bp = Blueprint('transport', __name__)
+
+
+@transport_bp.route('/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_transport(arrondissement):
+    """Desserte complete (metro + RER) d'un arrondissement."""
+    # Les donnees transport sont statiques : corps serialise une fois au
+    # demarrage, aucun encodage JSON sur ce chemin.
+    corps = data_loader.PRESERIALIZED.get(('transport', arrondissement))
+    if corps is not None:
+        return format_response_cached_bytes(corps)
+    try:
+        transport = DataLoader.get_transport_cached(arrondissement)
+        if transport is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        score = TransportModel.calculer_score_accessibilite(transport)
+        return format_response({
+            'arrondissement': arrondissement,
+            **transport,
+            'score_accessibilite': score,
+            'accessibilite': TransportModel.classifier_accessibilite(score),
+        })
+    except Exception as e:
+        logger.error(f"Erreur dans get_transport: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@transport_bp.route('/metro/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_metro(arrondissement):
+    """Desserte metro d'un arrondissement."""
+    try:
+        # Payload fige au chargement, numero inclus : pas de splat de dict
+        # par requete.
+        payload = TRANSPORT_METRO_RESP.get(arrondissement)
+        if payload is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response(payload)
+    except Exception as e:
+        logger.error(f"Erreur dans get_metro: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@transport_bp.route('/rer/<int:arrondissement>')
+@cache.cached(timeout=3600, query_string=True)
+@valider_arrondissement
+def get_rer(arrondissement):
+    """Desserte RER d'un arrondissement."""
+    try:
+        payload = TRANSPORT_RER_RESP.get(arrondissement)
+        if payload is None:
+            return format_error(
+                f"Donnees introuvables pour l'arrondissement {arrondissement}", 404)
+        return format_response(payload)
+    except Exception as e:
+        logger.error(f"Erreur dans get_rer: {e}")
+        return format_error("Erreur interne du serveur", 500)
+
+
+@transport_bp.route('/classement')
+@cache.cached(timeout=3600, query_string=True)
+def get_classement_transport():
+    """Classement des arrondissements selon un critere de transport."""
+    critere = request.args.get('critere', 'trafic_metro')
+    vals = CRITERES_TRANSPORT.get(critere)
+    if vals is None:
+        return format_error(f"Critere invalide : {critere}", 400)
+    try:
+        # Tri C via argsort sur le vecteur precharge (NaN relegues en queue).
+        ordre = np.argsort(-np.nan_to_num(vals, nan=-np.inf), kind='stable')
+        classement = [
+            {
+                'arrondissement': int(i + 1),
+                'valeur': None if np.isnan(vals[i]) else int(vals[i]),
+                'classement': position,
+            }
+            for position, i in enumerate(ordre, start=1)
+        ]
+        return format_response({'critere': critere, 'classement': classement})
+    except Exception as e:
+        logger.error(f"Erreur dans get_classement_transport: {e}")
+        return format_error("Erreur interne du serveur", 500)
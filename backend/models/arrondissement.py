@@ -0,0 +1,330 @@
+"""Modele d'un arrondissement parisien (une ligne de la table Gold)."""
+
+import math
+import sys
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+import models.arrondissement_store as arrondissement_store
+from models.base import BaseModel
+from models.logement import TYPOLOGIES, TYPES_LOCAUX
+from models.pollution import PollutionModel
+from models.prix import PrixModel
+from models.transport import TransportModel
+from services.kernels import repartition_kernel
+
+ANNEES = range(2020, 2026)
+
+# Tables de cles precalculees et internees : les annees couvrent 2020-2025,
+# toutes les cles d'evolution existent donc a l'import. Le getter fait un
+# seul lookup a chaine internee au lieu d'allouer une f-string par appel.
+_EVOL_PRIX_KEYS = {
+    (debut, debut + 1): sys.intern(f'evolution_prix_{debut}_{debut + 1}_pct')
+    for debut in range(2020, 2025)
+}
+_EVOL_M2_KEYS = {
+    (debut, debut + 1): sys.intern(f'evolution_prix_m2_{debut}_{debut + 1}_pct')
+    for debut in range(2020, 2025)
+}
+_EVOL_LABELS = {
+    debut: sys.intern(f'{debut}_{debut + 1}') for debut in range(2020, 2025)
+}
+
+# Tuples de cles de comptes par annee : le chemin de repli de
+# _repartition fait une seule comprehension sur un tuple precalcule au
+# lieu de formatter deux f-strings par categorie a chaque appel.
+_NB_PIECES_KEYS = {
+    annee: tuple(sys.intern(f'nb_{t}_{annee}') for t in TYPOLOGIES)
+    for annee in ANNEES
+}
+_NB_TYPES_KEYS = {
+    annee: tuple(sys.intern(f'nb_{t}_{annee}') for t in TYPES_LOCAUX)
+    for annee in ANNEES
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Demographie:
+    """Vue demographique figee d'un arrondissement.
+
+    Dataclass gelee plutot que dict : allocation plus legere, hashable,
+    et orjson la serialise nativement avec les memes cles. Les autres
+    vues (transport, qualite de l'air, tendance) restent des dicts : leurs
+    appelants les splattent avec ** et elles sont deja memoisees par
+    instance, la conversion n'apporterait qu'un cout de traduction.
+    """
+
+    nom: str
+    population_2018: int
+
+
+@lru_cache(maxsize=64)
+def _parse_lignes_cached(lignes_str):
+    """Decoupe une liste de lignes 'a,b,c' memoisee sur la chaine brute.
+
+    Les chaines Gold ne changent pas apres chargement : le split n'est
+    paye qu'une fois par valeur distincte. Tuple en sortie (immuable,
+    partageable entre caches).
+    """
+    if not lignes_str:
+        return ()
+    return tuple(l.strip() for l in str(lignes_str).split(',') if l.strip())
+
+
+class Arrondissement(BaseModel):
+    """Vue metier sur les donnees Gold d'un arrondissement."""
+
+    __slots__ = ('numero',)
+
+    def __init__(self, numero, data):
+        super().__init__(data)
+        self.numero = numero
+
+    # ----- Prix -----
+    # Les getters par (instance, annee) sont memoises et lisent le store
+    # colonnaire : une indexation (numero - 1, annee - 2020) remplace la
+    # construction de cle f-string + lookup de dict.
+
+    def _lire_matrice(self, matrice, annee, cle):
+        store = arrondissement_store.STORE
+        if store is None:
+            return self._data.get(cle.format(annee))
+        valeur = getattr(store, matrice)[self.numero - 1, annee - 2020]
+        # NaN = valeur absente ; les matrices ne contiennent que des
+        # entiers de la table Gold, convertis au bord de l'API.
+        return None if np.isnan(valeur) else int(valeur)
+
+    @lru_cache(maxsize=None)
+    def get_prix_m2_median(self, annee):
+        """Prix median au m² pour une annee."""
+        return self._lire_matrice('prix_m2_median', annee, 'prix_m2_median_{}')
+
+    @lru_cache(maxsize=None)
+    def get_prix_median(self, annee):
+        """Prix de vente median pour une annee."""
+        return self._lire_matrice('prix_median', annee, 'prix_median_{}')
+
+    @lru_cache(maxsize=None)
+    def get_nb_ventes(self, annee):
+        """Nombre de ventes pour une annee."""
+        return self._lire_matrice('nb_ventes', annee, 'nb_ventes_{}')
+
+    def construire_series_annuelles(self):
+        """Compacte les evolutions annuelles en array.array contigus.
+
+        Chaque serie remplace cinq entrees de dict par un bloc de doubles
+        de 40 octets (NaN en sentinelle d'absence), sans wrapper PyFloat
+        avant l'acces. Stockee dans _cache pour ne pas polluer _data (et
+        donc to_dict/orjson, qui ne serialisent pas array.array).
+        """
+        for nom, cles in (('evolution_prix_series', _EVOL_PRIX_KEYS),
+                          ('evolution_prix_m2_series', _EVOL_M2_KEYS)):
+            valeurs = (self._data.get(cles[(debut, debut + 1)])
+                       for debut in range(2020, 2025))
+            self._cache[nom] = array(
+                'd', (math.nan if v is None else v for v in valeurs))
+
+    def _lire_serie_evolution(self, nom, cles, debut, fin):
+        serie = self._cache.get(nom)
+        if serie is not None:
+            if fin != debut + 1 or not 2020 <= debut <= 2024:
+                return None
+            valeur = serie[debut - 2020]
+            return None if math.isnan(valeur) else valeur
+        cle = cles.get((debut, fin))
+        return self._data.get(cle) if cle is not None else None
+
+    def get_evolution_prix(self, debut, fin):
+        """Evolution (%) du prix median entre deux annees consecutives."""
+        return self._lire_serie_evolution(
+            'evolution_prix_series', _EVOL_PRIX_KEYS, debut, fin)
+
+    def get_evolution_prix_m2(self, debut, fin):
+        """Evolution (%) du prix au m² median entre deux annees consecutives."""
+        return self._lire_serie_evolution(
+            'evolution_prix_m2_series', _EVOL_M2_KEYS, debut, fin)
+
+    @lru_cache(maxsize=None)
+    def get_tendance_prix(self):
+        """Tendance globale des prix et volatilite de la serie prix/m²."""
+        serie = [self.get_prix_m2_median(annee) for annee in ANNEES]
+        evolutions = {}
+        for debut in range(2020, 2025):
+            valeur = self.get_evolution_prix_m2(debut, debut + 1)
+            if valeur is not None:
+                evolutions[_EVOL_LABELS[debut]] = valeur
+        return {
+            'tendance': self._data.get('tendance_prix'),
+            'volatilite_pct': PrixModel.calculer_volatilite(serie),
+            'evolutions': evolutions,
+        }
+
+    # ----- Logement -----
+
+    def get_logements_sociaux_apur(self):
+        """Logements sociaux (inventaire APUR 2023)."""
+        return {
+            'nb_logements_sociaux': self._data.get('nb_logements_sociaux_2023'),
+            'taux_pct': self._data.get('taux_logements_sociaux_pct'),
+            'source': 'APUR 2023',
+        }
+
+    def _repartition(self, annee, categories):
+        """Comptes, pourcentages et categorie dominante via le noyau compile."""
+        store = arrondissement_store.STORE
+        if store is None:
+            cles = (_NB_PIECES_KEYS if categories is TYPOLOGIES
+                    else _NB_TYPES_KEYS)[annee]
+            comptes = np.array(
+                [self._data.get(cle) or 0 for cle in cles],
+                dtype=np.float64)
+        else:
+            # Ligne contigue du cube (arr, annee, categorie) : ni f-string
+            # ni construction d'array par appel.
+            cube = (store.nb_pieces if categories is TYPOLOGIES
+                    else store.nb_types)
+            comptes = cube[self.numero - 1, annee - 2020]
+        total, pcts, dominant = repartition_kernel(comptes)
+        repartition = {
+            categorie: {
+                'nb': int(comptes[i]),
+                'pct': float(pcts[i]) if total > 0 else None,
+            }
+            for i, categorie in enumerate(categories)
+        }
+        return int(total), repartition, categories[dominant]
+
+    def get_repartition_pieces(self, annee=2024):
+        """Repartition des ventes d'appartements par typologie (T1-T5+)."""
+        total, repartition, dominante = self._repartition(annee, TYPOLOGIES)
+        return {
+            'annee': annee,
+            'total': total,
+            'repartition': repartition,
+            'typologie_dominante': dominante,
+        }
+
+    def get_repartition_types(self, annee=2024):
+        """Repartition des ventes par type de local."""
+        total, repartition, dominant = self._repartition(annee, TYPES_LOCAUX)
+        return {
+            'annee': annee,
+            'total': total,
+            'repartition': repartition,
+            'type_dominant': dominant,
+        }
+
+    def get_synthese_typologie_2024(self):
+        """Synthese logement 2024 : typologies, types et logements sociaux."""
+        synthese = self._cache.get('synthese_2024')
+        if synthese is not None:
+            return synthese
+        pieces = self.get_repartition_pieces(2024)
+        types = self.get_repartition_types(2024)
+        synthese = {
+            'annee': 2024,
+            'typologie_dominante': pieces['typologie_dominante'],
+            'type_dominant': types['type_dominant'],
+            'nb_ventes_appartements': pieces['total'],
+            'logements_sociaux': self.get_logements_sociaux_apur(),
+        }
+        self._cache['synthese_2024'] = synthese
+        return synthese
+
+    # ----- Pollution -----
+
+    def get_qualite_air(self):
+        """Concentrations moyennes et indice global de qualite de l'air."""
+        qualite_air = self._cache.get('qualite_air')
+        if qualite_air is not None:
+            return qualite_air
+        no2 = self._data.get('no2_moyen')
+        pm10 = self._data.get('pm10_moyen')
+        o3 = self._data.get('o3_moyen')
+        qualite_air = {
+            'no2_moyen': no2,
+            'pm10_moyen': pm10,
+            'o3_moyen': o3,
+            'qualite_dominante': self._data.get('qualite_air_dominante'),
+        }
+        # Indice materialise au chargement (_build_qualite_derivees) : la
+        # lecture n'a plus de calcul a faire ; le recalcul ne sert que de
+        # repli si les derivees n'ont pas ete construites.
+        indice = self._data.get('indice_air')
+        if indice is not None:
+            qualite_air['indice_global'] = {
+                'indice': indice,
+                'qualite': self._data.get('qualite_air_calculee'),
+                'polluant_principal': self._data.get('polluant_principal_air'),
+            }
+        elif no2 is not None and pm10 is not None and o3 is not None:
+            qualite_air['indice_global'] = PollutionModel.calculer_indice_global(
+                no2, pm10, o3)
+        self._cache['qualite_air'] = qualite_air
+        return qualite_air
+
+    # ----- Transport -----
+
+    def _parse_lignes(self, lignes_str):
+        """Decoupe une liste de lignes 'a,b,c' en liste de chaines."""
+        # Liste au bord de l'API seulement ; le parse lui-meme est memoise.
+        return list(_parse_lignes_cached(lignes_str))
+
+    def get_transport(self):
+        """Desserte metro et RER de l'arrondissement."""
+        transport = self._cache.get('transport')
+        if transport is not None:
+            return transport
+        lignes_metro = TransportModel.trier_lignes(
+            self._parse_lignes(self._data.get('lignes_metro')))
+        lignes_rer = TransportModel.trier_lignes(
+            self._parse_lignes(self._data.get('lignes_rer')))
+        transport = {
+            'metro': {
+                'nb_stations': self._data.get('nb_stations_metro'),
+                'trafic_total': self._data.get('trafic_total_metro'),
+                'lignes': lignes_metro,
+                'nb_lignes': len(lignes_metro),
+            },
+            'rer': {
+                'nb_stations': self._data.get('nb_stations_rer'),
+                'trafic_total': self._data.get('trafic_total_rer'),
+                'lignes': lignes_rer,
+                'nb_lignes': len(lignes_rer),
+            },
+        }
+        self._cache['transport'] = transport
+        return transport
+
+    # ----- Demographie -----
+
+    def get_demographie(self):
+        """Donnees demographiques de base (instance figee, serialisee
+        nativement par orjson)."""
+        demographie = self._cache.get('demographie')
+        if demographie is None:
+            demographie = Demographie(
+                nom=self._data.get('nom_arrondissement'),
+                population_2018=self._data.get('population_2018'),
+            )
+            self._cache['demographie'] = demographie
+        return demographie
+
+    # ----- Serialisation -----
+
+    def to_dict(self, include_all=False):
+        """Resume de l'arrondissement, ou donnees completes si demande."""
+        if include_all:
+            # dict | dict : fusion en C, plus rapide que le splat ** sous
+            # CPython recent.
+            return {'numero': self.numero} | self._data
+        return {
+            'numero': self.numero,
+            'nom': self._data.get('nom_arrondissement'),
+            'population_2018': self._data.get('population_2018'),
+            'prix_m2_median_2024': self.get_prix_m2_median(2024),
+            'qualite_air_dominante': self._data.get('qualite_air_dominante'),
+        }
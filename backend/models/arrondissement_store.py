@@ -0,0 +1,80 @@
+"""Stockage colonnaire (SoA) des attributs annuels des arrondissements.
+
+Les donnees Gold sont naturellement colonnaires : une matrice NumPy par
+famille d'attributs, indexee (numero - 1, annee - 2020), remplace les
+lookups de dict a cle f-string des getters. Un scan analytique (« tous
+les prix m² 2024 ») devient une tranche contigue au lieu de 20 lookups.
+"""
+
+import numpy as np
+
+from models.logement import TYPOLOGIES, TYPES_LOCAUX
+
+ANNEES = range(2020, 2026)
+
+
+class ArrondissementStore:
+    """Matrices annuelles par attribut, NaN pour les valeurs absentes."""
+
+    __slots__ = ('prix_m2_median', 'prix_median', 'nb_ventes',
+                 'nb_pieces', 'nb_types', 'no2_moyen', 'pm10_moyen',
+                 'o3_moyen', 'polluants', 'population_2018',
+                 'nb_stations_metro', 'nb_stations_rer')
+
+    def __init__(self, colonnes):
+        self.prix_m2_median = self._matrice(colonnes, 'prix_m2_median_{}')
+        self.prix_median = self._matrice(colonnes, 'prix_median_{}')
+        self.nb_ventes = self._matrice(colonnes, 'nb_ventes_{}')
+        # Comptes de ventes par typologie / type de local : cube
+        # (arr, annee, categorie), zero pour les categories absentes comme
+        # le faisait le `or 0` de l'ancien chemin dict.
+        self.nb_pieces = self._cube(colonnes, TYPOLOGIES)
+        self.nb_types = self._cube(colonnes, TYPES_LOCAUX)
+        # Attributs scalaires (non annuels) en vecteurs plats de longueur
+        # 20 : les comparateurs et classements indexent directement.
+        self.no2_moyen = self._vecteur(colonnes, 'no2_moyen')
+        self.pm10_moyen = self._vecteur(colonnes, 'pm10_moyen')
+        self.o3_moyen = self._vecteur(colonnes, 'o3_moyen')
+        self.polluants = np.column_stack(
+            (self.no2_moyen, self.pm10_moyen, self.o3_moyen))
+        self.population_2018 = self._vecteur(colonnes, 'population_2018')
+        self.nb_stations_metro = self._vecteur(colonnes, 'nb_stations_metro')
+        self.nb_stations_rer = self._vecteur(colonnes, 'nb_stations_rer')
+
+    @staticmethod
+    def _matrice(colonnes, gabarit):
+        m = np.full((20, len(ANNEES)), np.nan)
+        for j, annee in enumerate(ANNEES):
+            col = colonnes.get(gabarit.format(annee))
+            if col is not None:
+                m[:, j] = col
+        return m
+
+    @staticmethod
+    def _vecteur(colonnes, nom):
+        col = colonnes.get(nom)
+        if col is None:
+            return np.full(20, np.nan)
+        return np.asarray(col, dtype=np.float64)
+
+    @staticmethod
+    def _cube(colonnes, categories):
+        c = np.zeros((20, len(ANNEES), len(categories)))
+        for j, annee in enumerate(ANNEES):
+            for k, categorie in enumerate(categories):
+                col = colonnes.get(f'nb_{categorie}_{annee}')
+                if col is not None:
+                    c[:, j, k] = np.nan_to_num(col)
+        return c
+
+
+# Instance unique, construite par le DataLoader apres le chargement des
+# colonnes Gold. None tant que les donnees ne sont pas chargees : les
+# getters retombent alors sur le dict brut.
+STORE = None
+
+
+def build_store(colonnes):
+    """Materialise le store colonnaire a partir des colonnes Gold."""
+    global STORE
+    STORE = ArrondissementStore(colonnes)
@@ -0,0 +1,37 @@
+"""Modele de base : acces generique aux donnees d'une ligne Gold."""
+
+from types import MappingProxyType
+
+
+class BaseModel:
+    """Encapsule un dictionnaire de donnees issu de la couche Gold."""
+
+    # Pas de __dict__ par instance : acces aux attributs par offset fixe.
+    # _cache memorise les vues calculees couteuses (agregations multi-cles),
+    # invalidees uniquement par update().
+    __slots__ = ('_data', '_cache')
+
+    def __init__(self, data):
+        self._data = data or {}
+        self._cache = {}
+
+    def get(self, cle, defaut=None):
+        """Retourne la valeur brute d'une cle, ou `defaut` si absente."""
+        return self._data.get(cle, defaut)
+
+    def to_dict(self):
+        """Retourne une vue en lecture seule du dictionnaire de donnees.
+
+        MappingProxyType evite la copie de centaines d'entrees par appel ;
+        les rares appelants qui veulent muter passent par to_dict_mutable.
+        """
+        return MappingProxyType(self._data)
+
+    def to_dict_mutable(self):
+        """Retourne une copie mutable du dictionnaire de donnees."""
+        return self._data.copy()
+
+    def update(self, valeurs):
+        """Met a jour les donnees (utilise uniquement au rechargement)."""
+        self._data.update(valeurs)
+        self._cache.clear()
@@ -0,0 +1,40 @@
+"""Typologies de logements (T1 a T5+) et types de locaux."""
+
+TYPOLOGIES = ('t1', 't2', 't3', 't4', 't5plus')
+
+TYPOLOGIE_LIBELLES = {
+    't1': 'Studio / T1',
+    't2': 'T2',
+    't3': 'T3',
+    't4': 'T4',
+    't5plus': 'T5 et plus',
+}
+
+TYPES_LOCAUX = ('appartement', 'maison', 'local', 'dependance')
+
+TYPE_LIBELLES = {
+    'appartement': 'Appartement',
+    'maison': 'Maison',
+    'local': 'Local commercial',
+    'dependance': 'Dépendance',
+}
+
+
+class LogementModel:
+    """Calculs sur la repartition des logements."""
+
+    @staticmethod
+    def typologie_dominante(repartition):
+        """Retourne la typologie la plus representee d'un dict {typo: nb}."""
+        if not repartition:
+            return None
+        # max sur les cles avec dict.get comme cle de tri : ni liste de
+        # tuples ni lambda Python par element.
+        return max(repartition, key=repartition.get)
+
+    @staticmethod
+    def calculer_pct(nb, total):
+        """Pourcentage arrondi a une decimale (None si total nul)."""
+        if not total:
+            return None
+        return round(nb / total * 100, 1)
@@ -0,0 +1,177 @@
+"""Classification de la qualite de l'air par polluant."""
+
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+
+import numpy as np
+
+import models.arrondissement_store as arrondissement_store
+
+SEUILS_NO2 = {'bon': 40, 'moyen': 90, 'mauvais': 150}
+SEUILS_PM10 = {'bon': 20, 'moyen': 50, 'mauvais': 100}
+SEUILS_O3 = {'bon': 60, 'moyen': 120, 'mauvais': 240}
+
+# Seuils en sequences triees + table de labels partagee : le chemin
+# scalaire classe par bisection (bisect_left == semantique <=) et le
+# chemin batch par np.searchsorted, sans branche Python par valeur.
+_NO2_SEUILS = (40, 90, 150)
+_PM10_SEUILS = (20, 50, 100)
+_O3_SEUILS = (60, 120, 240)
+# Labels internes : une seule instance str par label, y compris en sortie
+# des chemins batch (les comparaisons aval deviennent des comparaisons de
+# pointeurs et les cles de dict re-hachent la meme chaine).
+_LABELS = tuple(map(sys.intern, ('Bon', 'Moyen', 'Médiocre', 'Mauvais')))
+
+_NO2_SEUILS_ARR = np.array(_NO2_SEUILS)
+_PM10_SEUILS_ARR = np.array(_PM10_SEUILS)
+_O3_SEUILS_ARR = np.array(_O3_SEUILS)
+
+# Constantes du noyau d'indice global : seuils 'mauvais' par polluant
+# (colonnes NO2, PM10, O3) et seuils de qualite sur l'indice 0-100.
+_SEUILS_MAUVAIS_ARR = np.array([150.0, 100.0, 240.0])
+_INDICE_SEUILS_ARR = np.array([30.0, 50.0, 75.0])
+_POLLUANTS = tuple(map(sys.intern, ('NO2', 'PM10', 'O3')))
+
+
+# Classifieurs memoises sur la valeur arrondie : les concentrations
+# moyennes se repetent d'une requete a l'autre (20 arrondissements, pas
+# de decimales significatives au µg/m³ pres), un hit est un seul lookup.
+
+@lru_cache(maxsize=256)
+def _classifier_no2(valeur):
+    return _LABELS[bisect_left(_NO2_SEUILS, valeur)]
+
+
+@lru_cache(maxsize=256)
+def _classifier_pm10(valeur):
+    return _LABELS[bisect_left(_PM10_SEUILS, valeur)]
+
+
+@lru_cache(maxsize=256)
+def _classifier_o3(valeur):
+    return _LABELS[bisect_left(_O3_SEUILS, valeur)]
+
+
+class PollutionModel:
+    """Classifications et indices de pollution (concentrations en µg/m³)."""
+
+    @staticmethod
+    def classifier_no2(valeur):
+        """Classe une concentration moyenne de NO2."""
+        return _classifier_no2(round(valeur))
+
+    @staticmethod
+    def classifier_pm10(valeur):
+        """Classe une concentration moyenne de PM10."""
+        return _classifier_pm10(round(valeur))
+
+    @staticmethod
+    def classifier_o3(valeur):
+        """Classe une concentration moyenne d'O3."""
+        return _classifier_o3(round(valeur))
+
+    # Versions batch : un searchsorted C classe N valeurs d'un coup, pour
+    # les classements et comparaisons sur les 20 arrondissements.
+
+    @staticmethod
+    def classifier_no2_batch(valeurs):
+        """Classe un vecteur de concentrations de NO2."""
+        return [_LABELS[i] for i in np.searchsorted(_NO2_SEUILS_ARR, valeurs)]
+
+    @staticmethod
+    def classifier_pm10_batch(valeurs):
+        """Classe un vecteur de concentrations de PM10."""
+        return [_LABELS[i] for i in np.searchsorted(_PM10_SEUILS_ARR, valeurs)]
+
+    @staticmethod
+    def classifier_o3_batch(valeurs):
+        """Classe un vecteur de concentrations d'O3."""
+        return [_LABELS[i] for i in np.searchsorted(_O3_SEUILS_ARR, valeurs)]
+
+    @staticmethod
+    def calculer_indice_global_batch(polluants):
+        """Calcule les indices globaux d'un lot d'arrondissements.
+
+        `polluants` est un tableau (N, 3) de colonnes NO2/PM10/O3 ; chaque
+        polluant est rapporte a son seuil 'mauvais' et l'indice retenu est
+        celui du polluant le plus penalisant. Retourne un dict de tableaux
+        de longueur N (indices arrondis, labels de qualite, polluant
+        principal) : N classifications en une demi-douzaine d'ops NumPy.
+        """
+        scores = np.minimum(polluants / _SEUILS_MAUVAIS_ARR * 100.0, 100.0)
+        indices = scores.max(axis=1)
+        # Labels repris des tuples internes (et non d'un fancy-indexing
+        # ndarray qui fabriquerait des np.str_ frais a chaque appel).
+        return {
+            'indice': np.round(indices, 1),
+            'qualite': [_LABELS[i] for i in
+                        np.searchsorted(_INDICE_SEUILS_ARR, indices)],
+            'polluant_principal': [_POLLUANTS[i] for i in
+                                   scores.argmax(axis=1)],
+        }
+
+    @staticmethod
+    def calculer_indice_global(no2, pm10, o3):
+        """Calcule un indice global 0-100 a partir des trois polluants.
+
+        Chemin scalaire : delegue au noyau batch sur un lot de taille 1
+        pour partager le meme code.
+        """
+        lot = PollutionModel.calculer_indice_global_batch(
+            np.array([[no2, pm10, o3]], dtype=np.float64))
+        return {
+            'indice': float(lot['indice'][0]),
+            'qualite': lot['qualite'][0],
+            'polluant_principal': lot['polluant_principal'][0],
+        }
+
+    @staticmethod
+    def _verdict_comparaison(indice_1, indice_2):
+        difference = round(indice_1 - indice_2, 1)
+        if abs(difference) < 5:
+            verdict = 'Qualité comparable'
+        elif difference < 0:
+            verdict = 'Premier arrondissement moins pollué'
+        else:
+            verdict = 'Second arrondissement moins pollué'
+        return {'indice_1': indice_1, 'indice_2': indice_2,
+                'difference': difference, 'verdict': verdict}
+
+    @staticmethod
+    def comparer_qualite_batch(indices):
+        """Verdicts de toutes les paires d'indices en une passe vectorisee.
+
+        Soustraction exterieure (N, N) puis np.select : remplace O(N²)
+        appels scalaires par trois ops NumPy.
+        """
+        differences = np.round(indices[:, None] - indices[None, :], 1)
+        verdicts = np.select(
+            [np.abs(differences) < 5, differences < 0],
+            ['Qualité comparable', 'Premier arrondissement moins pollué'],
+            default='Second arrondissement moins pollué')
+        return {'differences': differences, 'verdicts': verdicts}
+
+    @staticmethod
+    def comparer_qualite(qualite_air_1, qualite_air_2):
+        """Compare deux dictionnaires de qualite de l'air (cf. get_qualite_air)."""
+        lot = PollutionModel.calculer_indice_global_batch(np.array([
+            [qualite_air_1['no2_moyen'], qualite_air_1['pm10_moyen'],
+             qualite_air_1['o3_moyen']],
+            [qualite_air_2['no2_moyen'], qualite_air_2['pm10_moyen'],
+             qualite_air_2['o3_moyen']],
+        ], dtype=np.float64))
+        return PollutionModel._verdict_comparaison(
+            float(lot['indice'][0]), float(lot['indice'][1]))
+
+    @staticmethod
+    def comparer_qualite_par_numero(numero_1, numero_2):
+        """Compare deux arrondissements via le store colonnaire.
+
+        Indexe directement les lignes (numero - 1) de la matrice (20, 3)
+        de polluants : aucun passage par les dicts des instances.
+        """
+        lot = PollutionModel.calculer_indice_global_batch(
+            arrondissement_store.STORE.polluants[[numero_1 - 1, numero_2 - 1]])
+        return PollutionModel._verdict_comparaison(
+            float(lot['indice'][0]), float(lot['indice'][1]))
@@ -0,0 +1,128 @@
+"""Classification et calculs sur les prix immobiliers."""
+
+import math
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+# Seuils et labels de classification des prix au m² ; side='right' dans
+# searchsorted reproduit la semantique stricte `prix < seuil`.
+_PRIX_SEUILS = (8000, 10000, 12000, 14000)
+# Labels internes : chaque classification renvoie la meme instance str,
+# y compris depuis le chemin batch.
+_PRIX_LABELS = tuple(map(sys.intern, (
+    'Très abordable', 'Abordable', 'Moyen', 'Élevé', 'Très élevé')))
+
+_PRIX_SEUILS_ARR = np.array(_PRIX_SEUILS)
+
+
+# Les prix medians Gold sont des entiers qui se repetent d'une requete a
+# l'autre : memoisation sur la valeur exacte (pas de quantisation, les
+# seuils tombent sur des multiples de 100 et un arrondi fausserait la
+# classe pres des bornes) ; le miss est une bisection O(log k).
+
+@lru_cache(maxsize=256)
+def _classifier_prix(prix_m2):
+    return _PRIX_LABELS[bisect_right(_PRIX_SEUILS, prix_m2)]
+
+# Seuils de tendance, scindes pour reproduire exactement la semantique du
+# chemin scalaire : bornes negatives inclusives (>= -5, >= -2), bornes
+# positives exclusives (> 2, > 5).
+_TENDANCE_SEUILS_NEG = np.array([-5.0, -2.0])
+_TENDANCE_SEUILS_POS = np.array([2.0, 5.0])
+_TENDANCE_LABELS = tuple(map(sys.intern, (
+    'Forte baisse', 'Baisse', 'Stable', 'Hausse', 'Forte hausse')))
+
+
+class PrixModel:
+    """Calculs derives des prix de vente et prix au m²."""
+
+    @staticmethod
+    def classifier_prix(prix_m2):
+        """Classe un prix au m² (en euros)."""
+        return _classifier_prix(prix_m2)
+
+    @staticmethod
+    def classifier_prix_batch(prix_m2):
+        """Classe un vecteur de prix au m² en un seul searchsorted."""
+        return [_PRIX_LABELS[i] for i in
+                np.searchsorted(_PRIX_SEUILS_ARR, prix_m2, side='right')]
+
+    @staticmethod
+    def calculer_evolution(prix_debut, prix_fin):
+        """Calcule l'evolution en % entre deux prix et sa tendance."""
+        if not prix_debut:
+            return None
+        evolution_pct = (prix_fin - prix_debut) / prix_debut * 100
+
+        if evolution_pct > 5:
+            tendance = 'Forte hausse'
+        elif evolution_pct > 2:
+            tendance = 'Hausse'
+        elif evolution_pct >= -2:
+            tendance = 'Stable'
+        elif evolution_pct >= -5:
+            tendance = 'Baisse'
+        else:
+            tendance = 'Forte baisse'
+
+        return {'evolution_pct': round(evolution_pct, 1), 'tendance': tendance}
+
+    @staticmethod
+    def calculer_evolution_batch(prix_debut, prix_fin):
+        """Evolutions (%) et tendances pour des vecteurs de prix.
+
+        Calcule N evolutions en quelques ops NumPy au lieu de N appels
+        scalaires. Les lignes dont le prix de depart est nul ou manquant
+        ressortent en NaN : l'appelant doit les masquer avant d'utiliser
+        le label de tendance correspondant.
+        """
+        prix_debut = np.asarray(prix_debut, dtype=np.float64)
+        prix_fin = np.asarray(prix_fin, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            evolutions = np.where(
+                prix_debut != 0,
+                (prix_fin - prix_debut) / prix_debut * 100.0,
+                np.nan)
+        indices = (np.searchsorted(_TENDANCE_SEUILS_NEG, evolutions, side='right')
+                   + np.searchsorted(_TENDANCE_SEUILS_POS, evolutions, side='left'))
+        return {
+            'evolution_pct': np.round(evolutions, 1),
+            'tendance': [_TENDANCE_LABELS[i] for i in np.minimum(indices, 4)],
+        }
+
+    @staticmethod
+    def calculer_volatilite(serie_prix):
+        """Ecart-type relatif (%) d'une serie de prix annuels."""
+        valeurs = [p for p in serie_prix if p is not None]
+        n = len(valeurs)
+        if n < 2:
+            return None
+        # Les series sont minuscules (au plus 6 annees) : la boucle
+        # mean/variance manuelle evite la construction d'un ndarray et le
+        # dispatch ufunc, qui dominent le cout a cette taille.
+        if n < 32:
+            moyenne = sum(valeurs) / n
+            if not moyenne:
+                return None
+            variance = sum((v - moyenne) ** 2 for v in valeurs) / n
+            return round(math.sqrt(variance) / moyenne * 100, 1)
+        moyenne = np.mean(valeurs)
+        if not moyenne:
+            return None
+        return round(float(np.std(valeurs) / moyenne * 100), 1)
+
+    @staticmethod
+    def calculer_rang_percentile(prix, tous_prix):
+        """Position (percentile 0-100) d'un prix parmi l'ensemble des prix.
+
+        L'ancienne version passait `prix` comme valeur de percentile a
+        np.percentile, ce qui renvoyait un prix interpole et non un rang ;
+        la bisection sur la liste triee donne le rang correct en O(log n).
+        """
+        valeurs = sorted(p for p in tous_prix if p is not None)
+        if not valeurs:
+            return None
+        return int(100 * bisect_left(valeurs, prix) / len(valeurs))
@@ -0,0 +1,117 @@
+"""Accessibilite en transports du reseau ferre."""
+
+import sys
+
+import numpy as np
+
+# Verdicts de comparaison partages par les chemins scalaire et batch.
+_VERDICT_COMPARABLE = 'Accessibilité comparable'
+_VERDICT_PREMIER = 'Premier arrondissement mieux desservi'
+_VERDICT_SECOND = 'Second arrondissement mieux desservi'
+
+
+class TransportModel:
+    """Calculs sur la desserte metro/RER des arrondissements."""
+
+    @staticmethod
+    def trier_lignes(lignes):
+        """Trie les lignes : numeriques (ordre naturel), puis lettres, puis mixtes.
+
+        Triage en une seule passe (un isdigit/isalpha par element) au lieu
+        de trois comprehensions qui re-classifiaient chaque chaine.
+        """
+        chiffres, lettres, autres = [], [], []
+        for ligne in lignes:
+            if ligne.isdigit():
+                chiffres.append(ligne)
+            elif ligne.isalpha():
+                lettres.append(ligne)
+            else:
+                autres.append(ligne)
+        chiffres.sort(key=int)
+        lettres.sort()
+        autres.sort()
+        return chiffres + lettres + autres
+
+    @staticmethod
+    def trier_lignes_batch(listes):
+        """Trie plusieurs listes de lignes, en internant chaque chaine.
+
+        Les memes noms de lignes reviennent dans tous les arrondissements :
+        sys.intern fait pointer toutes les listes vers une seule instance
+        par nom et accelere les comparaisons ulterieures.
+        """
+        return [
+            TransportModel.trier_lignes([sys.intern(l) for l in lignes])
+            for lignes in listes
+        ]
+
+    @staticmethod
+    def calculer_score_accessibilite(transport):
+        """Score d'accessibilite a partir d'un dict transport (cf. get_transport)."""
+        metro = transport.get('metro', {})
+        rer = transport.get('rer', {})
+        score = (
+            metro.get('nb_stations', 0) * 2
+            + metro.get('nb_lignes', 0) * 5
+            + rer.get('nb_stations', 0) * 3
+            + rer.get('nb_lignes', 0) * 4
+        )
+        return score
+
+    @staticmethod
+    def classifier_accessibilite(score):
+        """Classe un score d'accessibilite."""
+        if score >= 80:
+            return 'Excellente'
+        elif score >= 50:
+            return 'Bonne'
+        elif score >= 25:
+            return 'Moyenne'
+        return 'Faible'
+
+    @staticmethod
+    def score_all(nb_stations_metro, nb_lignes_metro,
+                  nb_stations_rer, nb_lignes_rer):
+        """Scores d'accessibilite de tous les arrondissements d'un coup.
+
+        Memes ponderations que calculer_score_accessibilite, appliquees
+        a des vecteurs de longueur N (NaN traites comme 0, comme les
+        valeurs absentes du chemin scalaire).
+        """
+        return (np.nan_to_num(nb_stations_metro) * 2
+                + np.nan_to_num(nb_lignes_metro) * 5
+                + np.nan_to_num(nb_stations_rer) * 3
+                + np.nan_to_num(nb_lignes_rer) * 4)
+
+    @staticmethod
+    def comparer_accessibilite_batch(scores):
+        """Comparaison de toutes les paires en une soustraction exterieure.
+
+        Un comparatif complet de l'UI fait O(N²) paires ; plutot que N²
+        appels scalaires, une matrice (N, N) de differences et un
+        np.select classent tous les verdicts en trois ops vectorisees.
+        """
+        differences = scores[:, None] - scores[None, :]
+        verdicts = np.select(
+            [np.abs(differences) < 10, differences > 0],
+            [_VERDICT_COMPARABLE, _VERDICT_PREMIER],
+            default=_VERDICT_SECOND)
+        return {'differences': differences, 'verdicts': verdicts}
+
+    @staticmethod
+    def comparer_accessibilite(transport_1, transport_2):
+        """Compare l'accessibilite de deux arrondissements."""
+        score_1 = TransportModel.calculer_score_accessibilite(transport_1)
+        score_2 = TransportModel.calculer_score_accessibilite(transport_2)
+
+        difference = score_1 - score_2
+        if abs(difference) < 10:
+            verdict = _VERDICT_COMPARABLE
+        elif difference > 0:
+            verdict = _VERDICT_PREMIER
+        else:
+            verdict = _VERDICT_SECOND
+
+        return {'score_1': score_1, 'score_2': score_2,
+                'difference': difference, 'verdict': verdict}
@@ -0,0 +1,205 @@
+"""Cache applicatif en memoire avec TTL et eviction LRU."""
+
+import functools
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+# Horloge monotone : insensible aux sauts d'horloge murale (NTP, DST),
+# une comparaison par lecture sans soustraction d'age.
+_monotonic = time.monotonic
+
+logger = logging.getLogger(__name__)
+
+
+class CacheService:
+    """Cache cle/valeur borne, expiration par TTL et eviction LRU+LFU.
+
+    Une seule OrderedDict stocke des entrees [valeur, expires_at, hits] :
+    l'expiration se reduit a une comparaison par lecture, et la borne
+    max_size garantit que les cles jamais relues finissent par etre
+    evincees au lieu de fuir. A capacite, la victime est choisie parmi
+    la fenetre des entrees les moins recentes, celle qui compte le moins
+    de hits : un balayage ponctuel (scan des 20 arrondissements) ne
+    chasse donc pas les entrees reellement chaudes.
+    """
+
+    def __init__(self, default_ttl=300, max_size=1024):
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        # Les operations composees (expiration + suppression, insertion +
+        # eviction) ne sont pas atomiques : sous gunicorn --threads elles
+        # doivent etre serialisees pour eviter les KeyError croises.
+        self._lock = threading.Lock()
+        # Compteurs cumulatifs : get_stats les restitue en O(1) au lieu
+        # de rescanner toutes les entrees. Increments hors verrou pour
+        # hits/misses (approximatifs, voir get), sous verrou pour le reste.
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+        self._sweep_timer = None
+
+    def get(self, key):
+        """Retourne la valeur en cache, ou None si absente ou expiree."""
+        # Lecture sans verrou : dict.get est atomique sous le GIL, le cas
+        # nominal (hit non expire) ne paie donc aucune contention.
+        entree = self._cache.get(key)
+        if entree is None:
+            self._misses += 1
+            return None
+        if entree[1] < _monotonic():
+            with self._lock:
+                # Un autre thread a pu reinserer la cle entre-temps :
+                # ne supprimer que si l'entree est toujours expiree.
+                entree = self._cache.get(key)
+                if entree is not None and entree[1] < _monotonic():
+                    del self._cache[key]
+                    self._expirations += 1
+                    self._misses += 1
+                    return None
+            if entree is None:
+                self._misses += 1
+                return None
+        try:
+            self._cache.move_to_end(key)
+        except KeyError:
+            return None
+        # Increments hors verrou : une ecriture d'element est atomique
+        # sous le GIL, et un increment perdu sous concurrence ne fausse
+        # que des compteurs heuristiques.
+        entree[2] += 1
+        self._hits += 1
+        return entree[0]
+
+    def set(self, key, value, ttl=None):
+        """Stocke une valeur avec son TTL (en secondes)."""
+        with self._lock:
+            if key not in self._cache and len(self._cache) >= self.max_size:
+                self._evincer_une()
+            self._cache[key] = [value, _monotonic() + (ttl or self.default_ttl), 0]
+            self._cache.move_to_end(key)
+
+    def _evincer_une(self):
+        """Choisit et retire une victime (appele sous verrou, a capacite).
+
+        Parcourt la fenetre des entrees les moins recentes (10 % de la
+        capacite, 8 au minimum pour que les petits caches ne degenerent
+        pas en LRU pur) : une entree expiree est evincee d'office, sinon c'est
+        celle qui a le moins de hits qui part. Une cle encore relue
+        survit ainsi a un balayage de cles froides inserees apres elle.
+        """
+        fenetre = max(8, self.max_size // 10)
+        maintenant = _monotonic()
+        victime = None
+        victime_hits = None
+        for key, entree in self._cache.items():
+            if entree[1] < maintenant:
+                victime = key
+                break
+            if victime_hits is None or entree[2] < victime_hits:
+                victime = key
+                victime_hits = entree[2]
+            fenetre -= 1
+            if fenetre == 0:
+                break
+        del self._cache[victime]
+        self._evictions += 1
+
+    def delete(self, key):
+        """Supprime une entree du cache."""
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        """Vide entierement le cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self):
+        """Statistiques cumulatives du cache, en O(1).
+
+        Plus de scan des entrees par appel : les compteurs sont tenus a
+        jour au fil des operations, un operateur peut donc interroger
+        les stats sans bloquer les threads de requete.
+        """
+        return {
+            'entries': len(self._cache),
+            'hits': self._hits,
+            'misses': self._misses,
+            'expirations': self._expirations,
+            'evictions': self._evictions,
+        }
+
+    def start_sweeper(self, interval=60):
+        """Demarre le balayage periodique des entrees expirees.
+
+        Sans lui, une cle ecrite puis jamais relue n'expire que par
+        eviction a capacite : le balayage borne la memoire meme sous un
+        trafic write-once. Timer daemon, ne retient pas l'arret du
+        processus.
+        """
+        self._sweep(interval)
+
+    def _sweep(self, interval):
+        with self._lock:
+            maintenant = _monotonic()
+            expirees = [key for key, entree in self._cache.items()
+                        if entree[1] < maintenant]
+            for key in expirees:
+                del self._cache[key]
+            self._expirations += len(expirees)
+        self._sweep_timer = threading.Timer(interval, self._sweep, (interval,))
+        self._sweep_timer.daemon = True
+        self._sweep_timer.start()
+
+
+cache_service = CacheService()
+
+
+def memoized(maxsize=256):
+    """Memoisation sans TTL pour les fonctions pures a arguments hashables.
+
+    Simple alias de functools.lru_cache : le wrapper C de la stdlib rend
+    un hit bien moins cher que le decorateur `cached` en Python pur, qui
+    reste reserve aux entrees necessitant une expiration.
+    """
+    return functools.lru_cache(maxsize=maxsize)
+
+
+# Au-dela de ce nombre d'arguments, la cle tuple est condensee en un digest
+# de 16 octets : le cout du hachage devient constant quelle que soit la
+# taille des arguments (listes d'arrondissements, series), et le dict ne
+# retient pas de gros tuples en vie.
+_SEUIL_CLE_LONGUE = 8
+
+
+def cached(ttl=None, key_prefix=''):
+    """Decore une fonction pour mettre son resultat en cache."""
+    def decorator(func):
+        qualname = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Cle tuple hachee en C : pas de str(args)/str(kwargs) ni de
+            # concatenation jetable par appel. Les signatures longues
+            # passent par un digest BLAKE2b de taille fixe.
+            if len(args) + len(kwargs) > _SEUIL_CLE_LONGUE:
+                brut = pickle.dumps((key_prefix, qualname, args, kwargs),
+                                    protocol=pickle.HIGHEST_PROTOCOL)
+                cache_key = hashlib.blake2b(brut, digest_size=16).digest()
+            else:
+                cache_key = (key_prefix, qualname, args,
+                             tuple(sorted(kwargs.items())) if kwargs else ())
+            resultat = cache_service.get(cache_key)
+            if resultat is not None:
+                return resultat
+            resultat = func(*args, **kwargs)
+            cache_service.set(cache_key, resultat, ttl)
+            return resultat
+        return wrapper
+    return decorator
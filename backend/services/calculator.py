@@ -0,0 +1,141 @@
+"""Calculs statistiques generiques sur des series de valeurs."""
+
+import numpy as np
+
+from services.cache import memoized
+from services.kernels import normaliser_kernel, pearson_kernel, pente_kernel
+
+
+@memoized(maxsize=256)
+def _statistiques_memo(values):
+    """Calcul memoise sur un tuple : les memes series (historiques par
+    arrondissement) reviennent a chaque requete de comparaison."""
+    # Filtrage et reductions entierement en C : None devient NaN dans un
+    # fromiter unique, le masque retire les NaN en une passe, et les cinq
+    # quantiles (min/q25/mediane/q75/max) sortent d'un seul appel trie au
+    # lieu de reductions separees qui rebalayaient chacune le tableau.
+    arr = np.fromiter(
+        (np.nan if v is None else v for v in values),
+        dtype=np.float64, count=len(values))
+    arr = arr[~np.isnan(arr)]
+    if arr.size == 0:
+        return None
+    quantiles = np.percentile(arr, (0, 25, 50, 75, 100))
+    return {
+        'min': float(quantiles[0]),
+        'max': float(quantiles[4]),
+        'moyenne': round(float(arr.mean()), 1),
+        'mediane': float(quantiles[2]),
+        'ecart_type': round(float(arr.std()), 1),
+        'q25': float(quantiles[1]),
+        'q75': float(quantiles[3]),
+    }
+
+
+class Calculator:
+    """Statistiques descriptives utilisees par les endpoints de comparaison."""
+
+    @staticmethod
+    def calculer_statistiques(values):
+        """Statistiques descriptives d'une serie (None et NaN ignores)."""
+        return _statistiques_memo(tuple(values))
+
+    @staticmethod
+    def calculer_statistiques_batch(matrice):
+        """Statistiques descriptives ligne par ligne d'une matrice (N, T).
+
+        Toutes les reductions passent en un appel NumPy sur axis=1 au
+        lieu de N appels scalaires reconstruisant chacun leur tableau ;
+        les cinq quantiles sortent d'un seul nanpercentile partage.
+        Retourne une liste de dicts (None pour une ligne sans valeur),
+        memes cles que calculer_statistiques.
+        """
+        valides = np.count_nonzero(~np.isnan(matrice), axis=1)
+        # Les lignes vides sont neutralisees avant les reductions nan*
+        # (qui leveraient un RuntimeWarning), puis rendues comme None.
+        pleine = np.where(valides[:, None] > 0, matrice, 0.0)
+        quantiles = np.nanpercentile(pleine, (0, 25, 50, 75, 100), axis=1)
+        moyennes = np.round(np.nanmean(pleine, axis=1), 1)
+        ecarts = np.round(np.nanstd(pleine, axis=1), 1)
+        resultats = []
+        for i in range(matrice.shape[0]):
+            if valides[i] == 0:
+                resultats.append(None)
+                continue
+            resultats.append({
+                'min': float(quantiles[0, i]),
+                'max': float(quantiles[4, i]),
+                'moyenne': float(moyennes[i]),
+                'mediane': float(quantiles[2, i]),
+                'ecart_type': float(ecarts[i]),
+                'q25': float(quantiles[1, i]),
+                'q75': float(quantiles[3, i]),
+            })
+        return resultats
+
+    @staticmethod
+    def calculer_rang_percentile(value, all_values):
+        """Percentile (0-100) d'une valeur au sein d'une serie.
+
+        Tri C puis bisection : remplace le scan lineaire Python
+        `sum(1 for v ... if v <= value)` par un searchsorted O(log n).
+        """
+        arr = np.fromiter(
+            (np.nan if v is None else v for v in all_values),
+            dtype=np.float64, count=len(all_values))
+        arr = arr[~np.isnan(arr)]
+        if arr.size == 0:
+            return None
+        arr.sort()
+        rang = np.searchsorted(arr, value, side='right')
+        return int(rang * 100 / arr.size)
+
+    @staticmethod
+    def calculer_correlation(x, y):
+        """Correlation de Pearson entre deux series (paires valides uniquement)."""
+        # Filtrage par masque joint en C : plus de liste de paires ni de
+        # zip(*...) Python, une seule passe de conversion par serie.
+        xa = np.fromiter((np.nan if v is None else v for v in x),
+                         dtype=np.float64, count=len(x))
+        ya = np.fromiter((np.nan if v is None else v for v in y),
+                         dtype=np.float64, count=len(y))
+        masque = ~(np.isnan(xa) | np.isnan(ya))
+        xa = xa[masque]
+        ya = ya[masque]
+        if xa.size < 2:
+            return None
+        # Noyau compile : une seule passe fusionnee sur les deux vecteurs
+        # au lieu de cinq intermediaires NumPy.
+        r = pearson_kernel(xa, ya)
+        if np.isnan(r):
+            return None
+        return round(float(r), 3)
+
+    @staticmethod
+    def detecter_tendance(values):
+        """Tendance lineaire d'une serie ('hausse', 'baisse' ou 'stable')."""
+        clean_values = [v for v in values if v is not None and not np.isnan(v)]
+        if len(clean_values) < 2:
+            return None
+        arr = np.ascontiguousarray(clean_values, dtype=np.float64)
+        # Pente par noyau compile (equivalent a polyfit degre 1, sans
+        # construction de matrice de Vandermonde ni lstsq).
+        pente = float(pente_kernel(arr))
+        moyenne = float(arr.mean())
+        if moyenne and abs(pente / moyenne) < 0.01:
+            return 'stable'
+        return 'hausse' if pente > 0 else 'baisse'
+
+    @staticmethod
+    def normaliser(values, min_val=0.0, max_val=1.0):
+        """Normalise une serie dans l'intervalle [min_val, max_val]."""
+        arr = np.ascontiguousarray(values, dtype=np.float64)
+        arr_min = float(np.nanmin(arr))
+        arr_max = float(np.nanmax(arr))
+        if arr_max == arr_min:
+            return np.full_like(arr, min_val).tolist()
+        # Facteur d'echelle precalcule puis noyau fusionne : une seule
+        # multiplication-addition par element au lieu de quatre tableaux
+        # intermediaires (soustraction, division, mise a l'echelle, decalage).
+        inv_range = (max_val - min_val) / (arr_max - arr_min)
+        return normaliser_kernel(arr, arr_min, inv_range, min_val).tolist()
@@ -0,0 +1,494 @@
+"""Chargement des donnees Gold pour le backend."""
+
+import logging
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as papq
+
+import models.arrondissement_store as arrondissement_store
+from models.arrondissement import Arrondissement
+from models.pollution import PollutionModel
+from models.prix import PrixModel
+from models.transport import TransportModel
+
+logger = logging.getLogger(__name__)
+
+# Table de correspondance polluant -> colonne Gold : partagee entre la
+# validation des handlers et la selection de colonne, sans f-string par appel.
+POLLUANT_COL = {
+    'no2': 'no2_moyen',
+    'pm10': 'pm10_moyen',
+    'o3': 'o3_moyen',
+}
+
+# Les concentrations n'ont qu'une decimale significative : float32 suffit et
+# divise par deux les octets parcourus par les tris/reductions.
+_ARROW_TYPES = {
+    'Arrondissement': pa.int8(),
+    'no2_moyen': pa.float32(),
+    'pm10_moyen': pa.float32(),
+    'o3_moyen': pa.float32(),
+}
+
+# Colonnes quantisees : au moment de servir les valeurs, on restitue la
+# decimale de reference plutot que l'arrondi binaire du float32.
+_COLONNES_QUANTISEES = frozenset(('no2_moyen', 'pm10_moyen', 'o3_moyen'))
+
+# Agregats pollution figes au demarrage (les donnees Gold sont statiques) :
+# les endpoints /api/pollution/* se reduisent a des lectures de dict.
+PRECOMPUTED_RANKINGS = {}
+PRECOMPUTED_STATS = {}
+PRECOMPUTED_QUALITE_BUCKETS = {}
+
+# Stockage en colonnes (SoA) : chaque colonne du Gold est un ndarray contigu,
+# ce qui remplace les parcours de listes de dicts par des operations
+# vectorisees sur des tampons compacts.
+COLUMNS = {}
+ARR_IDS = None
+
+# Historiques de prix 2020-2025 en matrices (20, 6) indexees [arr-1, annee
+# d'indice annee-2020] : une lecture contigue remplace six appels de getter.
+HIST_M2 = None
+HIST_PRIX = None
+
+# Criteres de classement transport en vecteurs de longueur 20 (indice
+# arr-1, NaN si absent) : le tri des classements passe par np.argsort.
+CRITERES_TRANSPORT = {}
+
+# Dicts de desserte {metro: ..., rer: ...} figes au chargement : les
+# endpoints transport servent une reference au lieu de reconstruire la
+# structure a chaque appel.
+TRANSPORT_CACHE = {}
+
+# Payloads complets des endpoints /metro et /rer, numero inclus : les
+# handlers servent la reference telle quelle au lieu de re-splatter
+# {'arrondissement': n, **transport['metro']} a chaque requete.
+TRANSPORT_METRO_RESP = {}
+TRANSPORT_RER_RESP = {}
+
+# Scores d'accessibilite (vecteur de longueur 20) et matrices (20, 20) de
+# verdicts paire a paire, calcules une fois : un comparatif complet de
+# l'UI lit la matrice au lieu de refaire O(N²) comparaisons scalaires.
+ACCESS_SCORES = None
+PAIRWISE_COMPARAISONS = {}
+
+# Evolutions precalculees pour chaque (arr, annee_debut, annee_fin, type) :
+# 20 x 15 paires x 2 types = 600 entrees au plus, l'endpoint evolution se
+# reduit a un lookup de dict.
+EVOLUTION_TABLE = {}
+
+# Liste des 20 arrondissements materialisee une seule fois (tuple : les
+# appelants ne doivent pas la muter).
+_ALL_ARRS_TUPLE = None
+
+# Instances Arrondissement memoisees : 20 objets possibles, construits une
+# fois au chargement au lieu d'une instanciation par requete.
+ARRONDISSEMENT_CACHE = {}
+
+# Corps JSON pre-serialises (orjson) des reponses invariantes : la vue se
+# contente d'envoyer les bytes, sans reconstruction de dict ni re-encodage.
+PRESERIALIZED = {}
+
+
+class DataLoader:
+    """Acces au CSV Gold des arrondissements (charge une fois par processus)."""
+
+    _gold_dir = (Path(__file__).resolve().parents[2] / 'data' / 'gold')
+    _data_path = _gold_dir / 'dashboard_arrondissements_paris7.parquet'
+    _csv_fallback = _gold_dir / 'dashboard_arrondissements_paris7.csv'
+    _data_cache = None
+    _arrow_table = None
+
+    @classmethod
+    def load_data(cls):
+        """Charge (ou retourne) le DataFrame Gold.
+
+        Prefere la copie Parquet ecrite par gold.py : colonnes binaires
+        deja typees, lues sans tokenisation. A defaut, le CSV est parse
+        par pyarrow.csv (tokenisation et conversion vectorisees) plutot
+        que le moteur pandas par defaut.
+        """
+        if cls._data_cache is None:
+            if cls._data_path.exists():
+                logger.info(f"Chargement des donnees : {cls._data_path}")
+                table = papq.read_table(cls._data_path)
+                # Memes types serres que la lecture CSV (int8, float32) :
+                # les precalculs en aval restent bit a bit identiques.
+                schema = pa.schema([
+                    pa.field(champ.name, _ARROW_TYPES.get(champ.name, champ.type))
+                    for champ in table.schema
+                ])
+                cls._arrow_table = table.cast(schema)
+            else:
+                logger.info(f"Chargement des donnees : {cls._csv_fallback}")
+                cls._arrow_table = pacsv.read_csv(
+                    cls._csv_fallback,
+                    parse_options=pacsv.ParseOptions(delimiter=';'),
+                    convert_options=pacsv.ConvertOptions(column_types=_ARROW_TYPES),
+                )
+            # Index par numero d'arrondissement : la selection d'une ligne
+            # devient un acces hash .loc au lieu d'un masque booleen.
+            cls._data_cache = cls._arrow_table.to_pandas().set_index(
+                'Arrondissement', drop=False)
+            logger.info(f"{len(cls._data_cache)} arrondissements charges")
+        return cls._data_cache
+
+    @classmethod
+    def column(cls, name):
+        """Retourne la colonne demandee sous forme de ndarray contigu."""
+        if not COLUMNS:
+            _build_columns()
+        return COLUMNS[name]
+
+    @classmethod
+    def get_arrondissement(cls, numero):
+        """Retourne les donnees d'un arrondissement (dict a ne pas muter)."""
+        return _get_arrondissement_memo(numero)
+
+    @classmethod
+    def get_arrondissement_obj(cls, numero):
+        """Retourne l'instance Arrondissement memoisee (None si inconnue)."""
+        if not ARRONDISSEMENT_CACHE:
+            _build_arrondissement_cache()
+        return ARRONDISSEMENT_CACHE.get(numero)
+
+    @classmethod
+    def get_transport_cached(cls, numero):
+        """Retourne le dict de desserte fige (None si inconnu)."""
+        return TRANSPORT_CACHE.get(numero)
+
+    @classmethod
+    def get_all_arrondissements(cls):
+        """Retourne les 20 arrondissements (tuple memoise, a ne pas muter)."""
+        global _ALL_ARRS_TUPLE
+        if _ALL_ARRS_TUPLE is None:
+            df = cls.load_data()
+            _ALL_ARRS_TUPLE = tuple(
+                {cle: cls._sanitize(cle, valeur) for cle, valeur in record.items()}
+                for record in df.to_dict('records')
+            )
+        return _ALL_ARRS_TUPLE
+
+    @classmethod
+    def get_arrondissements_by_criteria(cls, prix_min=None, prix_max=None, annee=2024):
+        """Filtre les arrondissements par fourchette de prix au m².
+
+        Masque NumPy sur la colonne de prix puis indexation dans les
+        records deja sanitises de get_all_arrondissements : plus de
+        filtrage pandas ni de re-sanitisation par appel.
+        """
+        records = cls.get_all_arrondissements()
+        prix = cls.column(f'prix_m2_median_{annee}')
+        masque = None
+        if prix_min is not None:
+            masque = prix >= prix_min
+        if prix_max is not None:
+            borne = prix <= prix_max
+            masque = borne if masque is None else masque & borne
+        if masque is None:
+            return list(records)
+        return [records[i] for i in np.flatnonzero(masque)]
+
+    @classmethod
+    def get_stats_summary(cls):
+        """Statistiques globales du jeu de donnees (dict a ne pas muter)."""
+        return _get_stats_summary_memo()
+
+    @staticmethod
+    def _sanitize(cle, valeur):
+        """Convertit une valeur pandas en type JSON-serialisable."""
+        if pd.isna(valeur):
+            return None
+        if cle in _COLONNES_QUANTISEES:
+            return round(float(valeur), 1)
+        if hasattr(valeur, 'item'):
+            return valeur.item()
+        return valeur
+
+
+# Selecteurs memoises au niveau module (meme schema que les fonctions
+# lru_cache des modeles) : les donnees Gold sont statiques par processus,
+# un appel sur une cle deja vue est un lookup de dict C, sans filtrage
+# pandas ni re-sanitisation.
+@lru_cache(maxsize=32)
+def _get_arrondissement_memo(numero):
+    df = DataLoader.load_data()
+    try:
+        ligne = df.loc[numero]
+    except KeyError:
+        return None
+    return {cle: DataLoader._sanitize(cle, valeur)
+            for cle, valeur in ligne.items()}
+
+
+@lru_cache(maxsize=1)
+def _get_stats_summary_memo():
+    df = DataLoader.load_data()
+    # Une seule passe agg au lieu de trois reductions separees sur la
+    # meme colonne.
+    minimum, maximum, moyenne = df['prix_m2_median_2024'].agg(['min', 'max', 'mean'])
+    return {
+        'nb_arrondissements': len(df),
+        'prix_m2_moyen_2024': round(float(moyenne)),
+        'prix_m2_min_2024': int(minimum),
+        'prix_m2_max_2024': int(maximum),
+    }
+
+
+def _build_columns():
+    """Materialise les colonnes Gold en ndarray (SoA) depuis la table Arrow."""
+    global ARR_IDS
+    DataLoader.load_data()
+    table = DataLoader._arrow_table
+    for colonne in table.column_names:
+        COLUMNS[colonne] = table.column(colonne).to_numpy(zero_copy_only=False)
+    ARR_IDS = COLUMNS['Arrondissement']
+
+
+def _build_arrondissement_cache():
+    """Instancie une fois les 20 objets Arrondissement."""
+    for arr_data in DataLoader.get_all_arrondissements():
+        numero = int(arr_data['Arrondissement'])
+        ARRONDISSEMENT_CACHE[numero] = Arrondissement(numero, arr_data)
+
+
+def _build_qualite_derivees():
+    """Materialise l'indice de qualite de l'air au chargement.
+
+    Un seul passage du noyau batch sur la matrice (20, 3) de polluants ;
+    les lectures (get_qualite_air) deviennent de purs acces a _data au
+    lieu d'un calcul d'indice par requete.
+    """
+    lot = PollutionModel.calculer_indice_global_batch(
+        arrondissement_store.STORE.polluants)
+    for numero, arr in ARRONDISSEMENT_CACHE.items():
+        i = numero - 1
+        if np.isnan(lot['indice'][i]):
+            continue
+        arr.update({
+            'indice_air': float(lot['indice'][i]),
+            'qualite_air_calculee': str(lot['qualite'][i]),
+            'polluant_principal_air': str(lot['polluant_principal'][i]),
+        })
+    PAIRWISE_COMPARAISONS['qualite_air'] = (
+        PollutionModel.comparer_qualite_batch(lot['indice']))
+    # Apres le dernier update() : les series compactes ne seront plus
+    # invalidees par une ecriture dans _data.
+    for arr in ARRONDISSEMENT_CACHE.values():
+        arr.construire_series_annuelles()
+
+
+def _build_pollution_precomputes():
+    """Construit une fois les classements et statistiques de pollution.
+
+    Les colonnes de polluants sont des ndarray contigus (SoA) : tris et
+    reductions (min/max/moyenne) s'executent en C plutot qu'en boucles Python
+    sur des dicts.
+    """
+    arr_ids = ARR_IDS
+
+    for polluant, colonne in POLLUANT_COL.items():
+        vals = DataLoader.column(colonne)
+        masque = ~np.isnan(vals)
+        v = vals[masque]
+        ids = arr_ids[masque]
+        if v.size == 0:
+            continue
+        ordre_asc = np.argsort(v, kind='stable')
+        for ordre, indices in (('asc', ordre_asc), ('desc', ordre_asc[::-1])):
+            PRECOMPUTED_RANKINGS[(polluant, ordre)] = [
+                # Arrondi a 0.1 : restitue la valeur de reference malgre la
+                # representation float32.
+                {'arrondissement': int(ids[i]), 'valeur': round(float(v[i]), 1)}
+                for i in indices
+            ]
+        imin = int(v.argmin())
+        imax = int(v.argmax())
+        PRECOMPUTED_STATS[polluant] = {
+            'unite': 'µg/m³',
+            'moyenne': round(float(v.mean(dtype=np.float64)), 1),
+            'minimum': {'arrondissement': int(ids[imin]),
+                        'valeur': round(float(v[imin]), 1)},
+            'maximum': {'arrondissement': int(ids[imax]),
+                        'valeur': round(float(v[imax]), 1)},
+        }
+
+    # Passe unique : les lignes du Gold sont triees par arrondissement, les
+    # listes de details sortent donc deja ordonnees (pas de tri final).
+    qualites = DataLoader.column('qualite_air_dominante')
+    repartition = Counter()
+    details = defaultdict(list)
+    for numero, qualite in zip(arr_ids, qualites):
+        if isinstance(qualite, str) and qualite:
+            repartition[qualite] += 1
+            details[qualite].append(int(numero))
+    PRECOMPUTED_QUALITE_BUCKETS['repartition'] = dict(repartition)
+    PRECOMPUTED_QUALITE_BUCKETS['details'] = dict(details)
+
+
+def _build_hist_arrays():
+    """Empile les colonnes de prix annuelles en matrices (20, 6)."""
+    global HIST_M2, HIST_PRIX
+    annees = range(2020, 2026)
+    HIST_M2 = np.column_stack(
+        [DataLoader.column(f'prix_m2_median_{a}').astype(np.float64)
+         for a in annees])
+    HIST_PRIX = np.column_stack(
+        [DataLoader.column(f'prix_median_{a}').astype(np.float64)
+         for a in annees])
+
+
+def _build_evolution_table():
+    """Precalcule l'evolution de prix pour toutes les paires d'annees."""
+    for idx in range(HIST_M2.shape[0]):
+        for type_prix, hist in (('prix_m2', HIST_M2), ('prix', HIST_PRIX)):
+            for d in range(6):
+                vd = hist[idx, d]
+                if np.isnan(vd):
+                    continue
+                for f in range(d + 1, 6):
+                    vf = hist[idx, f]
+                    if np.isnan(vf):
+                        continue
+                    evolution = PrixModel.calculer_evolution(int(vd), int(vf))
+                    if evolution is None:
+                        continue
+                    cle = (idx + 1, 2020 + d, 2020 + f, type_prix)
+                    EVOLUTION_TABLE[cle] = {
+                        'valeur_debut': int(vd),
+                        'valeur_fin': int(vf),
+                        **evolution,
+                    }
+
+
+def _build_transport_criteria():
+    """Fige les dicts de desserte et vectorise les criteres de classement."""
+    for numero, arr in ARRONDISSEMENT_CACHE.items():
+        transport = arr.get_transport()
+        TRANSPORT_CACHE[numero] = transport
+        TRANSPORT_METRO_RESP[numero] = {
+            'arrondissement': numero, **transport['metro']}
+        TRANSPORT_RER_RESP[numero] = {
+            'arrondissement': numero, **transport['rer']}
+    criteres = {
+        'trafic_metro': ('metro', 'trafic_total'),
+        'stations_metro': ('metro', 'nb_stations'),
+        'lignes_metro': ('metro', 'nb_lignes'),
+        'trafic_rer': ('rer', 'trafic_total'),
+    }
+    for critere, (reseau, cle) in criteres.items():
+        vals = np.full(20, np.nan)
+        for numero, transport in TRANSPORT_CACHE.items():
+            valeur = transport[reseau][cle]
+            if valeur is not None:
+                vals[numero - 1] = valeur
+        CRITERES_TRANSPORT[critere] = vals
+
+    # Scores et verdicts paire a paire fusionnes en une passe batch.
+    global ACCESS_SCORES
+    composantes = {}
+    for reseau, cle in (('metro', 'nb_stations'), ('metro', 'nb_lignes'),
+                        ('rer', 'nb_stations'), ('rer', 'nb_lignes')):
+        vals = np.full(20, np.nan)
+        for numero, transport in TRANSPORT_CACHE.items():
+            valeur = transport[reseau][cle]
+            if valeur is not None:
+                vals[numero - 1] = valeur
+        composantes[(reseau, cle)] = vals
+    ACCESS_SCORES = TransportModel.score_all(
+        composantes[('metro', 'nb_stations')],
+        composantes[('metro', 'nb_lignes')],
+        composantes[('rer', 'nb_stations')],
+        composantes[('rer', 'nb_lignes')])
+    PAIRWISE_COMPARAISONS['transport'] = (
+        TransportModel.comparer_accessibilite_batch(ACCESS_SCORES))
+
+
+def _build_preserialized_responses():
+    """Serialise une fois les reponses des endpoints de liste invariants."""
+    resume = [
+        ARRONDISSEMENT_CACHE[numero].to_dict()
+        for numero in sorted(ARRONDISSEMENT_CACHE)
+    ]
+    PRESERIALIZED['arrondissements'] = orjson.dumps({
+        'success': True,
+        'data': {'nb_arrondissements': len(resume), 'arrondissements': resume},
+    })
+
+    # Court-circuits pour les requetes les plus frequentes : prix 2024
+    # (annee courante des tableaux de bord) et desserte transport, figes en
+    # bytes prets a emettre.
+    for numero in sorted(ARRONDISSEMENT_CACHE):
+        arr = ARRONDISSEMENT_CACHE[numero]
+        prix_m2 = arr.get_prix_m2_median(2024)
+        if prix_m2 is not None:
+            PRESERIALIZED[('prix_m2_2024', numero)] = orjson.dumps({
+                'success': True,
+                'data': {
+                    'arrondissement': numero,
+                    'annee': 2024,
+                    'prix_m2_median': prix_m2,
+                    'classification': PrixModel.classifier_prix(prix_m2),
+                },
+            })
+        PRESERIALIZED[('vente_2024', numero)] = orjson.dumps({
+            'success': True,
+            'data': {
+                'arrondissement': numero,
+                'annee': 2024,
+                'prix_median': arr.get_prix_median(2024),
+                'nb_ventes': arr.get_nb_ventes(2024),
+            },
+        })
+        transport = TRANSPORT_CACHE[numero]
+        score = TransportModel.calculer_score_accessibilite(transport)
+        PRESERIALIZED[('transport', numero)] = orjson.dumps({
+            'success': True,
+            'data': {
+                'arrondissement': numero,
+                **transport,
+                'score_accessibilite': score,
+                'accessibilite': TransportModel.classifier_accessibilite(score),
+            },
+        })
+
+    # /logements/tous est servi en streaming : un prefixe d'enveloppe par
+    # annee et un chunk de bytes par arrondissement, emis tels quels.
+    for annee in range(2020, 2026):
+        prefixe = (b'{"success":true,"data":{"annee":%d,"arrondissements":['
+                   % annee)
+        chunks = []
+        for numero in sorted(ARRONDISSEMENT_CACHE):
+            arr = ARRONDISSEMENT_CACHE[numero]
+            pieces = arr.get_repartition_pieces(annee)
+            chunks.append(orjson.dumps({
+                'arrondissement': numero,
+                'nom': arr.get('nom_arrondissement'),
+                'nb_ventes_appartements': pieces['total'],
+                'typologie_dominante': pieces['typologie_dominante'],
+                'repartition': pieces['repartition'],
+            }))
+        PRESERIALIZED[('logements_tous', annee)] = (prefixe, tuple(chunks))
+
+
+def initialize_data_loader():
+    """Charge les donnees et precalcule les agregats au demarrage."""
+    DataLoader.load_data()
+    _build_columns()
+    # Store colonnaire des modeles : construit des que les colonnes sont
+    # disponibles, les getters d'Arrondissement lisent ensuite des matrices.
+    arrondissement_store.build_store(COLUMNS)
+    _build_hist_arrays()
+    _build_evolution_table()
+    _build_arrondissement_cache()
+    _build_qualite_derivees()
+    _build_transport_criteria()
+    _build_pollution_precomputes()
+    _build_preserialized_responses()
@@ -0,0 +1,82 @@
+"""Noyaux numeriques compiles avec Numba pour les chemins chauds."""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def repartition_kernel(counts):
+    """Total, pourcentages (arrondis a 0,1) et indice dominant d'un vecteur de comptes."""
+    total = 0.0
+    for i in range(counts.shape[0]):
+        total += counts[i]
+    pcts = np.zeros(counts.shape[0], dtype=np.float64)
+    dominant = 0
+    for i in range(counts.shape[0]):
+        if total > 0:
+            pcts[i] = np.floor(counts[i] / total * 1000.0 + 0.5) / 10.0
+        if counts[i] > counts[dominant]:
+            dominant = i
+    return total, pcts, dominant
+
+
+@njit(cache=True)
+def pearson_kernel(x, y):
+    """Correlation de Pearson de deux vecteurs float64 contigus (sans NaN)."""
+    n = x.shape[0]
+    mx = 0.0
+    my = 0.0
+    for i in range(n):
+        mx += x[i]
+        my += y[i]
+    mx /= n
+    my /= n
+    sxy = 0.0
+    sxx = 0.0
+    syy = 0.0
+    for i in range(n):
+        dx = x[i] - mx
+        dy = y[i] - my
+        sxy += dx * dy
+        sxx += dx * dx
+        syy += dy * dy
+    denominateur = np.sqrt(sxx * syy)
+    if denominateur == 0.0:
+        return np.nan
+    return sxy / denominateur
+
+
+@njit(cache=True)
+def pente_kernel(values):
+    """Pente de la regression lineaire de values sur 0..n-1 (= polyfit deg 1)."""
+    n = values.shape[0]
+    mx = (n - 1) / 2.0
+    my = 0.0
+    for i in range(n):
+        my += values[i]
+    my /= n
+    sxy = 0.0
+    sxx = 0.0
+    for i in range(n):
+        dx = i - mx
+        sxy += dx * (values[i] - my)
+        sxx += dx * dx
+    return sxy / sxx
+
+
+@njit(cache=True)
+def normaliser_kernel(values, arr_min, inv_range, min_val):
+    """Transformation affine fusionnee : une multiplication-addition par element."""
+    out = np.empty(values.shape[0], dtype=np.float64)
+    for i in range(values.shape[0]):
+        out[i] = (values[i] - arr_min) * inv_range + min_val
+    return out
+
+
+def warm_kernels():
+    """Force la compilation des noyaux au demarrage (pas a la premiere requete)."""
+    repartition_kernel(np.zeros(5, dtype=np.float64))
+    deux = np.zeros(2, dtype=np.float64)
+    pearson_kernel(deux, deux)
+    pente_kernel(deux)
+    normaliser_kernel(deux, 0.0, 1.0, 0.0)
@@ -0,0 +1,23 @@
+"""Configuration CORS de l'API."""
+
+from flask_cors import CORS
+
+# 24 h (plafond Chromium) : le navigateur ne re-emet le preflight OPTIONS
+# qu'une fois par jour au lieu de toutes les heures.
+_MAX_AGE = 86400
+_METHODS = ("GET", "OPTIONS")
+_ALLOW_HEADERS = ("Content-Type",)
+
+
+def setup_cors(app):
+    """Active CORS sur les routes /api/* selon l'environnement."""
+    if app.config.get('ENV_NAME') == 'production':
+        origins = app.config.get('CORS_ORIGINS', [])
+    else:
+        origins = "*"
+    CORS(app, resources={r"/api/*": {
+        "origins": origins,
+        "methods": list(_METHODS),
+        "allow_headers": list(_ALLOW_HEADERS),
+        "max_age": _MAX_AGE,
+    }})
@@ -0,0 +1,24 @@
+"""Gestionnaires d'erreurs HTTP globaux."""
+
+import logging
+
+from views.response_formatter import format_error_plain as format_error
+
+logger = logging.getLogger(__name__)
+
+
+def register_error_handlers(app):
+    """Enregistre les reponses JSON des erreurs HTTP courantes."""
+
+    @app.errorhandler(404)
+    def not_found(error):
+        return format_error("Ressource introuvable", 404)
+
+    @app.errorhandler(405)
+    def method_not_allowed(error):
+        return format_error("Methode non autorisee", 405)
+
+    @app.errorhandler(500)
+    def internal_error(error):
+        logger.error(f"Erreur interne : {error}")
+        return format_error("Erreur interne du serveur", 500)
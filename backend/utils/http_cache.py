@@ -0,0 +1,45 @@
+"""Cache de reponses en octets au niveau WSGI.
+
+Court-circuite toute la pile (handler, modeles, serialisation) pour les
+GET repetes : un hit se reduit a un hash de tuple, un get de dict et
+l'ecriture socket. Borne LRU via OrderedDict pour que des query strings
+arbitraires ne fassent pas croitre la memoire sans limite.
+"""
+
+from collections import OrderedDict
+
+from flask import request
+
+# 4096 entrees ~ quelques Mo de corps JSON : largement au-dessus du
+# nombre de combinaisons (route, parametres) legitimes de l'API.
+_MAX_ENTREES = 4096
+
+
+def register_response_cache(app):
+    """Attache le cache de corps de reponses aux hooks de l'application."""
+    corps_caches = OrderedDict()
+
+    @app.before_request
+    def servir_depuis_cache():
+        if request.method != 'GET':
+            return None
+        cle = (request.path, request.query_string)
+        entree = corps_caches.get(cle)
+        if entree is None:
+            return None
+        corps_caches.move_to_end(cle)
+        return app.response_class(entree, mimetype='application/json')
+
+    @app.after_request
+    def memoriser_reponse(response):
+        if (request.method == 'GET'
+                and response.status_code == 200
+                and request.path.startswith('/api/')
+                and not response.is_streamed
+                and not response.direct_passthrough):
+            cle = (request.path, request.query_string)
+            if cle not in corps_caches:
+                corps_caches[cle] = response.get_data()
+                if len(corps_caches) > _MAX_ENTREES:
+                    corps_caches.popitem(last=False)
+        return response
@@ -0,0 +1,83 @@
+"""Journalisation de l'application et des requetes HTTP."""
+
+import itertools
+import logging
+import os
+import queue
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from flask import g, request
+
+logger = logging.getLogger('api.requests')
+
+# Identifiants de requete : compteur monotone prefixe par pid + instant de
+# demarrage. Unique par processus sans le syscall urandom d'uuid4 a chaque
+# requete.
+_REQ_COUNTER = itertools.count()
+_REQ_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+
+_INFO = logging.INFO
+
+
+def setup_logging(app):
+    """Configure le logger racine (sortie standard, ecriture asynchrone).
+
+    Le thread de requete ne fait que deposer le record dans une file ; le
+    formatage et l'ecriture sur stderr sont effectues par un QueueListener
+    en arriere-plan, hors du chemin chaud.
+    """
+    niveau = logging.DEBUG if app.config.get('DEBUG') else logging.INFO
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '[%(asctime)s] %(levelname)s %(name)s - %(message)s'))
+    root = logging.getLogger()
+    root.setLevel(niveau)
+    if not root.handlers:
+        file_records = queue.Queue(-1)
+        root.addHandler(QueueHandler(file_records))
+        listener = QueueListener(file_records, handler,
+                                 respect_handler_level=True)
+        listener.start()
+        app.extensions['log_listener'] = listener
+
+
+def register_request_logging(app):
+    """Attache le middleware de suivi des requetes (identifiant + duree)."""
+
+    @app.before_request
+    def before_request():
+        g.request_id = _REQ_PREFIX + format(next(_REQ_COUNTER), 'x')
+        g.start_ns = time.perf_counter_ns()
+        # Horodatage capture une fois par requete : les formatteurs de
+        # reponse le relisent au lieu de rappeler utcnow() + isoformat().
+        g.request_ts = datetime.utcnow().isoformat() + 'Z'
+        # Le dict extra et le parsing du User-Agent ne sont payes que si un
+        # handler INFO est effectivement actif.
+        if logger.isEnabledFor(_INFO):
+            logger.info("Requete recue", extra={
+                'request_id': g.request_id,
+                'http_method': request.method,
+                'http_path': request.path,
+                'ip': request.remote_addr,
+                'user_agent': request.headers.get('User-Agent', ''),
+            })
+
+    @app.after_request
+    def after_request(response):
+        # before_request s'execute pour toute requete dispatchee (y compris
+        # les 404 de routage) : g.start_ns est garanti present, le test
+        # hasattr par reponse est superflu.
+        if logger.isEnabledFor(_INFO):
+            # Horloge monotone en entiers : insensible aux ajustements NTP,
+            # pas d'arithmetique flottante ni d'arrondi.
+            duration_ms = (time.perf_counter_ns() - g.start_ns) // 1_000_000
+            logger.info("Requete traitee", extra={
+                'request_id': g.request_id,
+                'http_method': request.method,
+                'http_path': request.path,
+                'status': response.status_code,
+                'duration_ms': duration_ms,
+            })
+        return response
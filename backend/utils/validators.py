@@ -0,0 +1,45 @@
+"""Validation centralisee des parametres d'URL et de requete."""
+
+from functools import wraps
+
+# Bits 1 a 20 actives : un seul test de bit remplace la double comparaison
+# `1 <= n <= 20` repetee dans chaque handler.
+_VALID_ARR_MASK = (1 << 21) - 2
+
+_VALID_YEARS = frozenset(range(2020, 2026))
+
+# Types de prix acceptes par les endpoints /api/prix (frozenset hoiste :
+# pas de liste litterale reallouee a chaque requete).
+VALID_TYPES_PRIX = frozenset(('prix', 'prix_m2'))
+
+# Corps d'erreur figes pour les validations chaudes : aucun encodage JSON
+# sur le chemin d'erreur, et la valeur invalide n'est plus renvoyee au
+# client (les sondes malformees ne declenchent plus de travail par requete).
+ERR_ARR_INVALIDE = b'{"success":false,"error":"Arrondissement invalide"}'
+ERR_ANNEE_INVALIDE = b'{"success":false,"error":"Annee invalide"}'
+
+
+def is_valid_arr(n):
+    """True si n est un numero d'arrondissement parisien (1-20)."""
+    return bool(_VALID_ARR_MASK >> n & 1) if 0 <= n < 64 else False
+
+
+def is_valid_annee(annee):
+    """True si l'annee est couverte par les donnees Gold (2020-2025)."""
+    return annee in _VALID_YEARS
+
+
+def valider_arrondissement(func):
+    """Rejette en 404 les numeros d'arrondissement invalides.
+
+    Factorise le garde-fou repete en tete de chaque handler prenant un
+    `<int:arrondissement>` dans l'URL.
+    """
+    from views.response_formatter import format_response_cached_bytes
+
+    @wraps(func)
+    def wrapper(arrondissement, *args, **kwargs):
+        if not is_valid_arr(arrondissement):
+            return format_response_cached_bytes(ERR_ARR_INVALIDE, 404)
+        return func(arrondissement, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,106 @@
+"""Mise en forme uniforme des reponses JSON de l'API."""
+
+from datetime import datetime
+
+import orjson
+from flask import Response, g
+
+# Options communes : tableaux NumPy serialises nativement (plus besoin de
+# caster int()/float() element par element dans les handlers).
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Gabarits de l'enveloppe figes en bytes : les cles statiques ne sont plus
+# reconstruites ni re-encodees a chaque reponse, seul le payload passe par
+# orjson. Les champs optionnels ont chacun leur gabarit : l'enveloppe est
+# assemblee par concatenation, sans dict intermediaire a allouer puis jeter.
+_RESP_PREFIX = b'{"success":true,"data":'
+_ERR_PREFIX = b'{"success":false,"error":'
+_MSG_KEY = b',"message":'
+_META_KEY = b',"metadata":'
+_CODE_KEY = b',"error_code":'
+_DETAILS_KEY = b',"details":'
+_PAGINATION_KEY = b',"pagination":'
+_TS_KEY = b',"timestamp":"'
+_TS_SUFFIX = b'"}'
+
+
+def _horodatage():
+    """Horodatage de la requete courante, capture une seule fois.
+
+    Fige par before_request dans g : les reponses d'une meme requete
+    partagent le meme instant et ne repaient ni utcnow() ni isoformat().
+    Hors contexte de requete (tests, scripts), on retombe sur l'horloge.
+    """
+    horodatage = getattr(g, 'request_ts', None)
+    if horodatage is None:
+        horodatage = datetime.utcnow().isoformat() + 'Z'
+    return horodatage
+
+
+def _corps(prefixe, payload):
+    """Assemble l'enveloppe a partir des gabarits et du payload encode."""
+    return b''.join((prefixe, orjson.dumps(payload, option=_ORJSON_OPTS),
+                     _TS_KEY, _horodatage().encode(), _TS_SUFFIX))
+
+
+def _specialiser(prefixe):
+    """Fabrique la variante de forme fixe (payload seul) d'une enveloppe.
+
+    Evaluation partielle : le prefixe est fige dans la fermeture et les
+    branches sur message/metadata/error_code/details disparaissent du
+    bytecode. Les controleurs, qui n'emettent quasiment que cette forme,
+    importent la variante sous le nom generique ; la version a branches
+    reste disponible pour les rares reponses enrichies.
+    """
+    def variante(payload, status=200):
+        return Response(_corps(prefixe, payload), status=status,
+                        mimetype='application/json')
+    return variante
+
+
+format_response_plain = _specialiser(_RESP_PREFIX)
+format_error_plain = _specialiser(_ERR_PREFIX)
+
+
+def format_response(data, status=200, message=None, metadata=None):
+    """Enveloppe standard d'une reponse reussie."""
+    morceaux = [_RESP_PREFIX, orjson.dumps(data, option=_ORJSON_OPTS)]
+    if message:
+        morceaux += (_MSG_KEY, orjson.dumps(message))
+    if metadata:
+        morceaux += (_META_KEY, orjson.dumps(metadata, option=_ORJSON_OPTS))
+    morceaux += (_TS_KEY, _horodatage().encode(), _TS_SUFFIX)
+    return Response(b''.join(morceaux), status=status,
+                    mimetype='application/json')
+
+
+def format_response_cached_bytes(body_bytes, status=200):
+    """Reponse JSON construite a partir d'un corps deja serialise en bytes."""
+    return Response(body_bytes, status=status, mimetype='application/json')
+
+
+def format_error(message, status=400, error_code=None, details=None):
+    """Enveloppe standard d'une reponse d'erreur."""
+    morceaux = [_ERR_PREFIX, orjson.dumps(message)]
+    if error_code:
+        morceaux += (_CODE_KEY, orjson.dumps(error_code))
+    if details:
+        morceaux += (_DETAILS_KEY, orjson.dumps(details, option=_ORJSON_OPTS))
+    morceaux += (_TS_KEY, _horodatage().encode(), _TS_SUFFIX)
+    return Response(b''.join(morceaux), status=status,
+                    mimetype='application/json')
+
+
+def format_paginated_response(items, page, per_page, total, status=200):
+    """Enveloppe standard d'une reponse paginee."""
+    pagination = {
+        'page': page,
+        'per_page': per_page,
+        'total': total,
+        'pages': (total + per_page - 1) // per_page,
+    }
+    morceaux = (_RESP_PREFIX, orjson.dumps(items, option=_ORJSON_OPTS),
+                _PAGINATION_KEY, orjson.dumps(pagination),
+                _TS_KEY, _horodatage().encode(), _TS_SUFFIX)
+    return Response(b''.join(morceaux), status=status,
+                    mimetype='application/json')
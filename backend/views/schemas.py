@@ -0,0 +1,53 @@
+"""Schemas msgspec de validation des parametres de requete.
+
+Remplace Marshmallow : la conversion et les contraintes (bornes, enums)
+sont compilees en C par msgspec, la ou schema.load() dispatchait champ
+par champ en Python a chaque requete.
+"""
+
+from typing import Annotated, Literal
+
+import msgspec
+
+_ARRONDISSEMENT = Annotated[int, msgspec.Meta(ge=1, le=20)]
+_ANNEE = Annotated[int, msgspec.Meta(ge=2020, le=2025)]
+_TYPE_PRIX = Literal['prix', 'prix_m2']
+
+
+class ValidationError(ValueError):
+    """Parametres de requete invalides (meme surface que Marshmallow)."""
+
+    def __init__(self, messages):
+        super().__init__(str(messages))
+        self.messages = messages
+
+
+class ArrondissementSchema(msgspec.Struct):
+    """Valide un numero d'arrondissement parisien."""
+    arrondissement: _ARRONDISSEMENT
+
+
+class PrixQuerySchema(msgspec.Struct):
+    """Parametres communs des endpoints prix."""
+    annee: _ANNEE = 2024
+    type: _TYPE_PRIX = 'prix_m2'
+
+
+class ComparaisonQuerySchema(msgspec.Struct):
+    """Parametres de l'endpoint de comparaison entre arrondissements."""
+    arrondissements: str
+    annee: _ANNEE = 2024
+    type: _TYPE_PRIX = 'prix_m2'
+
+
+def charger(schema, args):
+    """Convertit un MultiDict de requete vers un Struct valide.
+
+    strict=False autorise la coercition str -> int des query strings ;
+    l'erreur msgspec est reemballee pour conserver l'attribut messages
+    attendu par les handlers.
+    """
+    try:
+        return msgspec.convert(args.to_dict(), schema, strict=False)
+    except msgspec.ValidationError as exc:
+        raise ValidationError(str(exc)) from None
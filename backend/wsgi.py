@@ -0,0 +1,17 @@
+"""Point d'entree WSGI de production.
+
+Un portage ASGI (Quart) a ete etudie puis ecarte : les handlers sont de
+purs lookups de dictionnaires precalcules, sans I/O attendable, et la
+journalisation est deja asynchrone (QueueListener hors du chemin de
+requete). Un event loop n'aurait rien a multiplexer ici. La concurrence
+par worker s'obtient avec des threads, les handlers ne tenant le GIL que
+quelques microsecondes :
+
+    gunicorn -w $(nproc) --threads 8 -b 0.0.0.0:5000 wsgi:app
+"""
+
+import os
+
+from app import create_app
+
+app = create_app(os.environ.get('FLASK_ENV', 'production'))
@@ -0,0 +1,387 @@
+"""Couche Gold : construction du CSV dashboard par arrondissement.
+
+Agrege les transactions immobilieres (couche Silver), la qualite de l'air et
+le trafic du reseau ferre (couche Bronze) en une table de 20 lignes — une par
+arrondissement — consommee par le backend Flask.
+
+Sortie : data/gold/dashboard_arrondissements_paris7.csv
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+from numba import njit
+
+GOLD_DIR = Path(__file__).resolve().parents[1]
+SILVER_DIR = GOLD_DIR.parents[0] / 'silver'
+BRONZE_DIR = GOLD_DIR.parents[0] / 'bronze'
+SORTIE = GOLD_DIR / 'dashboard_arrondissements_paris7.csv'
+SORTIE_PARQUET = GOLD_DIR / 'dashboard_arrondissements_paris7.parquet'
+
+ANNEES = list(range(2020, 2026))
+TYPOLOGIES = ['t1', 't2', 't3', 't4', 't5plus']
+
+# Types declares une fois : le lecteur pyarrow tokenise en parallele hors
+# GIL et livre des colonnes deja typees, sans inference ni allocation d'un
+# objet str Python par cellule numerique.
+DTYPES_AIR = {'no2': 'float64', 'pm10': 'float64', 'o3': 'float64'}
+TYPES_LOCAUX = {
+    'Appartement': 'appartement',
+    'Maison': 'maison',
+    'Local industriel. commercial ou assimilé': 'local',
+    'Dépendance': 'dependance',
+}
+
+NOMS_ARRONDISSEMENTS = {
+    1: 'Paris 1er', 2: 'Paris 2e', 3: 'Paris 3e', 4: 'Paris 4e',
+    5: 'Paris 5e', 6: 'Paris 6e', 7: 'Paris 7e', 8: 'Paris 8e',
+    9: 'Paris 9e', 10: 'Paris 10e', 11: 'Paris 11e', 12: 'Paris 12e',
+    13: 'Paris 13e', 14: 'Paris 14e', 15: 'Paris 15e', 16: 'Paris 16e',
+    17: 'Paris 17e', 18: 'Paris 18e', 19: 'Paris 19e', 20: 'Paris 20e',
+}
+
+# Recensement INSEE 2018 (population municipale par arrondissement)
+POPULATION_2018 = {
+    1: 16266, 2: 21586, 3: 34115, 4: 28088, 5: 58850, 6: 40898,
+    7: 51434, 8: 36249, 9: 59629, 10: 90836, 11: 146743, 12: 140296,
+    13: 181552, 14: 136368, 15: 233392, 16: 166361, 17: 167288,
+    18: 195233, 19: 187015, 20: 195604,
+}
+
+# Inventaire APUR 2023 des logements sociaux (SRU)
+LOGEMENTS_SOCIAUX_APUR = {
+    1: (350, 2.1), 2: (600, 3.5), 3: (1200, 5.4), 4: (1450, 5.9),
+    5: (2600, 7.0), 6: (950, 3.0), 7: (550, 1.6), 8: (900, 2.4),
+    9: (2500, 4.6), 10: (7200, 11.7), 11: (10900, 12.5), 12: (13900, 17.9),
+    13: (33600, 35.2), 14: (20200, 26.0), 15: (25500, 17.8), 16: (5600, 6.5),
+    17: (14700, 15.6), 18: (24700, 23.5), 19: (36700, 39.5), 20: (34000, 34.8),
+}
+
+
+def extraire_arrondissement_nom(noms_communes):
+    """Numeros d'arrondissement d'une Series de libelles 'Paris Xe Arrondissement'."""
+    numeros = pd.to_numeric(
+        noms_communes.str.extract(r'(\d+)', expand=False), errors='coerce')
+    return numeros.where((numeros >= 1) & (numeros <= 20))
+
+
+def extraire_arrondissement_insee(codes_insee):
+    """Numeros d'arrondissement d'une Series de codes INSEE 751xx."""
+    codes = pd.to_numeric(codes_insee, errors='coerce')
+    return (codes - 75100).where((codes >= 75101) & (codes <= 75120))
+
+
+def classifier_no2(valeur):
+    """Classe une concentration de NO2 (µg/m³)."""
+    if valeur <= 40:
+        return 'Bon'
+    elif valeur <= 90:
+        return 'Moyen'
+    elif valeur <= 150:
+        return 'Médiocre'
+    return 'Mauvais'
+
+
+# Seules colonnes consommees par les etapes 2 a 4 : la projection est
+# poussee dans le scan Polars, les colonnes inutiles (dates, communes,
+# coordonnees) ne sont jamais parsees.
+COLONNES_CLEAN = ['id_mutation', 'nature_mutation', 'valeur_fonciere',
+                  'code_postal', 'type_local', 'surface_reelle_bati',
+                  'nombre_pieces_principales']
+SCHEMA_CLEAN = {'valeur_fonciere': pl.Float64, 'code_postal': pl.Float64,
+                'surface_reelle_bati': pl.Float64,
+                'nombre_pieces_principales': pl.Float64}
+SCHEMA_LOTS = {'surface_carrez': pl.Float64}
+
+
+def charger_immobilier():
+    """Etape 1 : chargement des fichiers silver + jointure des surfaces Carrez.
+
+    Plan Polars paresseux par annee : scan multi-thread avec projection
+    des seules colonnes utiles, filtre des codes postaux parisiens et
+    jointure des paires Carrez dedupliquees, fusionnes par l'optimiseur
+    avant collect(). Le resultat repasse en pandas pour les etapes
+    suivantes (noyau Numba et typologies).
+    """
+    print("Etape 1 : chargement des transactions immobilieres")
+    donnees_immo_par_annee = {}
+    for annee in ANNEES:
+        # Jointure 1:N volontaire : une mutation multi-lots a plusieurs
+        # surfaces Carrez distinctes (600 a 1300 ids par an) et chaque lot
+        # compte comme une vente en aval. Un group_by('id_mutation').first()
+        # ecraserait ces lots et changerait comptes et medianes.
+        paires = (pl.scan_csv(SILVER_DIR / f'75_{annee}_lots.csv',
+                              schema_overrides=SCHEMA_LOTS)
+                  .unique(subset=['id_mutation', 'surface_carrez']))
+        code = pl.col('code_postal')
+        plan = (pl.scan_csv(SILVER_DIR / f'75_{annee}_clean.csv',
+                            schema_overrides=SCHEMA_CLEAN)
+                .select(COLONNES_CLEAN)
+                .filter(code.is_between(75001, 75020))
+                .with_columns((code - 75000).cast(pl.Int64).alias('arrondissement'))
+                .join(paires, on='id_mutation', how='left'))
+        df_clean = plan.collect().to_pandas()
+
+        # Colonnes d'enumeration en category : les egalites des etapes 2
+        # et 4 comparent des codes int8 au lieu de chaines Python.
+        for colonne in ('type_local', 'nature_mutation'):
+            df_clean[colonne] = df_clean[colonne].astype('category')
+
+        donnees_immo_par_annee[annee] = df_clean
+        print(f"  {annee} : {len(df_clean)} transactions")
+    return donnees_immo_par_annee
+
+
+@njit(cache=True)
+def _agreger_ventes(arrs, vf, prix_m2):
+    """Comptes et medianes par arrondissement en une passe bucketisee.
+
+    Noyau compile : comptage, remplissage de tampons contigus par
+    arrondissement puis mediane par tranche, sans tableaux booleens
+    intermediaires ni dispatch pandas par groupe. La mediane des valeurs
+    foncieres est interpolee (convention pandas), celle du prix/m² est
+    la mediane haute historique (element d'indice n//2).
+    """
+    n = arrs.shape[0]
+    nb = np.zeros(20, dtype=np.int64)
+    nb_vf = np.zeros(20, dtype=np.int64)
+    nb_m2 = np.zeros(20, dtype=np.int64)
+    for i in range(n):
+        a = arrs[i] - 1
+        nb[a] += 1
+        if not np.isnan(vf[i]):
+            nb_vf[a] += 1
+        if not np.isnan(prix_m2[i]):
+            nb_m2[a] += 1
+    debuts_vf = np.zeros(21, dtype=np.int64)
+    debuts_m2 = np.zeros(21, dtype=np.int64)
+    for a in range(20):
+        debuts_vf[a + 1] = debuts_vf[a] + nb_vf[a]
+        debuts_m2[a + 1] = debuts_m2[a] + nb_m2[a]
+    tampon_vf = np.empty(debuts_vf[20], dtype=np.float64)
+    tampon_m2 = np.empty(debuts_m2[20], dtype=np.float64)
+    pos_vf = debuts_vf[:20].copy()
+    pos_m2 = debuts_m2[:20].copy()
+    for i in range(n):
+        a = arrs[i] - 1
+        if not np.isnan(vf[i]):
+            tampon_vf[pos_vf[a]] = vf[i]
+            pos_vf[a] += 1
+        if not np.isnan(prix_m2[i]):
+            tampon_m2[pos_m2[a]] = prix_m2[i]
+            pos_m2[a] += 1
+    med_vf = np.full(20, np.nan)
+    med_m2 = np.full(20, np.nan)
+    for a in range(20):
+        tranche = np.sort(tampon_vf[debuts_vf[a]:debuts_vf[a + 1]])
+        m = tranche.shape[0]
+        if m > 0:
+            if m % 2:
+                med_vf[a] = tranche[m // 2]
+            else:
+                med_vf[a] = (tranche[m // 2 - 1] + tranche[m // 2]) / 2.0
+        tranche = np.sort(tampon_m2[debuts_m2[a]:debuts_m2[a + 1]])
+        m = tranche.shape[0]
+        if m > 0:
+            med_m2[a] = tranche[m // 2]
+    return nb, med_vf, med_m2
+
+
+def calculer_prix(donnees_immo_par_annee, resultats):
+    """Etape 2 : nombre de ventes, prix median et prix/m² median par arrondissement."""
+    print("Etape 2 : prix par arrondissement et par annee")
+    for annee in ANNEES:
+        df = donnees_immo_par_annee[annee]
+        df = df[df['nature_mutation'] == 'Vente']
+
+        # Colonnes derivees calculees une fois sur l'annee entiere : prix
+        # au m² des appartements (surface Carrez en repli, aberrants
+        # masques en NaN), puis le noyau compile bucketise par
+        # arrondissement au lieu de 20 masques booleens.
+        vf = pd.to_numeric(df['valeur_fonciere'], errors='coerce')
+        surface = pd.to_numeric(df['surface_reelle_bati'], errors='coerce')
+        carrez = pd.to_numeric(df['surface_carrez'], errors='coerce')
+        surface = surface.where(surface > 0, carrez)
+        surface = surface.where(surface > 0)
+        prix_m2 = (vf / surface).where(df['type_local'] == 'Appartement')
+        prix_m2 = prix_m2.where((prix_m2 > 3000) & (prix_m2 < 50000))
+
+        nb_ventes, prix_medians, prix_m2_medians = _agreger_ventes(
+            df['arrondissement'].to_numpy(dtype=np.int64),
+            vf.to_numpy(dtype=np.float64),
+            prix_m2.to_numpy(dtype=np.float64))
+
+        for arr in range(1, 21):
+            resultats[arr][f'nb_ventes_{annee}'] = int(nb_ventes[arr - 1])
+            mediane = prix_medians[arr - 1]
+            resultats[arr][f'prix_median_{annee}'] = (
+                int(mediane) if not np.isnan(mediane) else None)
+            mediane = prix_m2_medians[arr - 1]
+            resultats[arr][f'prix_m2_median_{annee}'] = (
+                int(mediane) if not np.isnan(mediane) else None)
+
+
+def calculer_evolutions(resultats):
+    """Etape 3 : evolutions annuelles des prix et tendance globale.
+
+    Les medianes sont rassemblees en matrices (20 arrondissements x
+    annees) et toutes les evolutions d'un prefixe sortent d'une seule
+    operation (M[:, 1:] - M[:, :-1]) / M[:, :-1]. Une mediane absente ou
+    nulle devient NaN, meme semantique que le test de verite de l'ancienne
+    boucle ; les cles sont reinserees dans l'ordre historique, qui fixe
+    l'ordre des colonnes du CSV.
+    """
+    print("Etape 3 : evolutions et tendances")
+    arrs = range(1, 21)
+    evolutions = {}
+    for prefixe in ('prix', 'prix_m2'):
+        matrice = np.array(
+            [[resultats[arr].get(f'{prefixe}_median_{annee}') or np.nan
+              for annee in ANNEES] for arr in arrs], dtype=np.float64)
+        evolutions[prefixe] = np.round(
+            (matrice[:, 1:] - matrice[:, :-1]) / matrice[:, :-1] * 100, 1)
+
+    # Tendance 2020-2024 : moyenne des evolutions prix/m² valides, puis
+    # classement par seuils en bloc.
+    fenetre = evolutions['prix_m2'][:, :len(ANNEES) - 2]
+    nb_valides = (~np.isnan(fenetre)).sum(axis=1)
+    moyennes = np.divide(np.nansum(fenetre, axis=1), nb_valides,
+                         out=np.full(len(fenetre), np.nan), where=nb_valides > 0)
+    tendances = np.select(
+        [moyennes > 5, moyennes > 2, moyennes >= -2, moyennes >= -5],
+        ['Forte hausse', 'Hausse', 'Stable', 'Baisse'], default='Forte baisse')
+
+    for ligne, arr in enumerate(arrs):
+        for i in range(len(ANNEES) - 1):
+            for prefixe in ('prix', 'prix_m2'):
+                cle = f'evolution_{prefixe}_{ANNEES[i]}_{ANNEES[i + 1]}_pct'
+                valeur = evolutions[prefixe][ligne, i]
+                resultats[arr][cle] = None if np.isnan(valeur) else float(valeur)
+        resultats[arr]['tendance_prix'] = (str(tendances[ligne])
+                                           if nb_valides[ligne] else None)
+
+
+def calculer_typologies(donnees_immo_par_annee, resultats):
+    """Etape 4 : repartition par typologie (T1-T5+) et par type de local."""
+    print("Etape 4 : typologies des logements")
+    for annee in ANNEES:
+        df = donnees_immo_par_annee[annee]
+        df = df[df['nature_mutation'] == 'Vente']
+        for arr in range(1, 21):
+            # Tranches en lecture seule : plus aucun .copy() defensif, la
+            # conversion des pieces vit dans une Series independante au
+            # lieu d'etre reecrite dans le DataFrame.
+            df_arr = df[df['arrondissement'] == arr]
+
+            # Typologies : appartements avec nombre de pieces renseigne
+            masque_appart = df_arr['type_local'] == 'Appartement'
+            pieces = pd.to_numeric(
+                df_arr.loc[masque_appart, 'nombre_pieces_principales'],
+                errors='coerce')
+            pieces = pieces[pieces > 0]
+
+            comptes = {t: 0 for t in TYPOLOGIES}
+            for valeur in pieces:
+                nb_pieces = int(valeur)
+                if nb_pieces >= 5:
+                    comptes['t5plus'] += 1
+                else:
+                    comptes[f't{nb_pieces}'] += 1
+            total = sum(comptes.values())
+            for typologie in TYPOLOGIES:
+                resultats[arr][f'nb_{typologie}_{annee}'] = comptes[typologie]
+                if total > 0:
+                    pct = round(comptes[typologie] / total * 100, 1)
+                else:
+                    pct = None
+                resultats[arr][f'pct_{typologie}_{annee}'] = pct
+
+            # Types de locaux
+            total_locaux = len(df_arr)
+            for libelle, cle in TYPES_LOCAUX.items():
+                nb = int((df_arr['type_local'] == libelle).sum())
+                resultats[arr][f'nb_{cle}_{annee}'] = nb
+                if total_locaux > 0:
+                    resultats[arr][f'pct_{cle}_{annee}'] = round(nb / total_locaux * 100, 1)
+                else:
+                    resultats[arr][f'pct_{cle}_{annee}'] = None
+
+
+def calculer_pollution(resultats):
+    """Etape 5 : moyennes de pollution et qualite de l'air dominante."""
+    print("Etape 5 : qualite de l'air")
+    df = pd.read_csv(BRONZE_DIR / 'air_quality_paris.csv',
+                     engine='pyarrow', dtype=DTYPES_AIR)
+    df['arrondissement'] = extraire_arrondissement_insee(df['ninsee'])
+    df = df[df['arrondissement'].notna()]
+    for arr in range(1, 21):
+        df_arr = df[df['arrondissement'] == arr]
+        resultats[arr]['no2_moyen'] = round(float(df_arr['no2'].mean()), 1)
+        resultats[arr]['pm10_moyen'] = round(float(df_arr['pm10'].mean()), 1)
+        resultats[arr]['o3_moyen'] = round(float(df_arr['o3'].mean()), 1)
+
+        # Qualite dominante : classe la plus frequente sur les releves NO2
+        comptes = {}
+        for valeur in df_arr['no2']:
+            classe = classifier_no2(valeur)
+            comptes[classe] = comptes.get(classe, 0) + 1
+        resultats[arr]['qualite_air_dominante'] = max(comptes.items(), key=lambda x: x[1])[0]
+
+
+def calculer_transport(resultats):
+    """Etape 6 : stations, trafic et lignes du reseau ferre par arrondissement."""
+    print("Etape 6 : transport")
+    df = pd.read_csv(
+        BRONZE_DIR / 'trafic-annuel-entrant-par-station-du-reseau-ferre-2021.csv',
+        sep=';', encoding='utf-8-sig', engine='pyarrow')
+    df = df[df['Arrondissement pour Paris'].notna()]
+
+    for arr in range(1, 21):
+        df_arr = df[df['Arrondissement pour Paris'] == arr]
+        for reseau, suffixe in [('Métro', 'metro'), ('RER', 'rer')]:
+            df_reseau = df_arr[df_arr['Réseau'] == reseau]
+            lignes = set()
+            for colonne in ['Correspondance_1', 'Correspondance_2', 'Correspondance_3',
+                            'Correspondance_4', 'Correspondance_5']:
+                for valeur in df_reseau[colonne].dropna():
+                    valeur = str(valeur).strip()
+                    if valeur and valeur != 'nan':
+                        lignes.add(valeur.removesuffix('.0'))
+            resultats[arr][f'nb_stations_{suffixe}'] = len(df_reseau)
+            resultats[arr][f'trafic_total_{suffixe}'] = int(df_reseau['Trafic'].sum())
+            resultats[arr][f'lignes_{suffixe}'] = ','.join(sorted(lignes))
+
+
+def main():
+    print("=== Couche Gold : dashboard arrondissements ===")
+    resultats = {}
+    for arr in range(1, 21):
+        nb_sociaux, taux_sociaux = LOGEMENTS_SOCIAUX_APUR[arr]
+        resultats[arr] = {
+            'Arrondissement': arr,
+            'nom_arrondissement': NOMS_ARRONDISSEMENTS[arr],
+            'population_2018': POPULATION_2018[arr],
+            'nb_logements_sociaux_2023': nb_sociaux,
+            'taux_logements_sociaux_pct': taux_sociaux,
+        }
+
+    donnees_immo_par_annee = charger_immobilier()
+    calculer_prix(donnees_immo_par_annee, resultats)
+    calculer_evolutions(resultats)
+    calculer_typologies(donnees_immo_par_annee, resultats)
+    calculer_pollution(resultats)
+    calculer_transport(resultats)
+
+    df_gold = pd.DataFrame([resultats[arr] for arr in range(1, 21)])
+    df_gold.to_csv(SORTIE, sep=';', index=False)
+    # Copie Parquet pour le backend : colonnes binaires typees, lues sans
+    # tokenisation CSV ni re-conversion au demarrage.
+    df_gold.to_parquet(SORTIE_PARQUET, engine='pyarrow', index=False)
+    print(f"Ecrit : {SORTIE} ({len(df_gold)} lignes, {len(df_gold.columns)} colonnes)")
+    print(f"Ecrit : {SORTIE_PARQUET}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Couche Silver : nettoyage des fichiers DVF bruts (couche Bronze).
+
+Pour chaque annee 2020-2025, produit :
+  - 75_{annee}_clean.csv : transactions nettoyees (colonnes utiles, lignes valides)
+  - 75_{annee}_lots.csv  : surfaces Carrez par mutation (pour completer
+    surface_reelle_bati quand elle est absente)
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+BRONZE_DIR = Path(__file__).resolve().parents[1] / 'bronze'
+SILVER_DIR = Path(__file__).resolve().parent
+
+ANNEES = range(2020, 2026)
+
+COLONNES_CLEAN = [
+    'id_mutation', 'date_mutation', 'nature_mutation', 'valeur_fonciere',
+    'code_postal', 'nom_commune', 'type_local', 'surface_reelle_bati',
+    'nombre_pieces_principales', 'longitude', 'latitude',
+]
+
+COLONNES_CARREZ = [
+    'lot1_surface_carrez', 'lot2_surface_carrez', 'lot3_surface_carrez',
+    'lot4_surface_carrez', 'lot5_surface_carrez',
+]
+
+
+def nettoyer_annee(annee):
+    """Nettoie le fichier DVF d'une annee et ecrit les fichiers silver."""
+    chemin = BRONZE_DIR / f'75_{annee}.csv'
+    print(f"  Lecture de {chemin.name}...")
+    df = pd.read_csv(chemin, low_memory=False)
+
+    # Lots : premiere surface Carrez disponible par mutation
+    df_lots = df[['id_mutation'] + COLONNES_CARREZ].copy()
+    df_lots['surface_carrez'] = df_lots[COLONNES_CARREZ].bfill(axis=1).iloc[:, 0]
+    df_lots = df_lots.dropna(subset=['surface_carrez'])
+    df_lots[['id_mutation', 'surface_carrez']].to_csv(
+        SILVER_DIR / f'75_{annee}_lots.csv', index=False)
+
+    # Transactions : on ne garde que les lignes exploitables
+    df_clean = df[COLONNES_CLEAN].copy()
+    df_clean = df_clean.dropna(subset=['valeur_fonciere', 'code_postal', 'type_local'])
+    df_clean = df_clean[df_clean['valeur_fonciere'] > 0]
+    df_clean.to_csv(SILVER_DIR / f'75_{annee}_clean.csv', index=False)
+
+    print(f"  {annee} : {len(df_clean)} transactions, {len(df_lots)} lots")
+
+
+def main():
+    print("=== Couche Silver : nettoyage DVF ===")
+    for annee in ANNEES:
+        nettoyer_annee(annee)
+    print("Termine.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Construction de l'entrepot de donnees (schema en etoile).
+
+A partir des couches Silver et Gold, produit dans data/warehouse/ :
+  - fact_transactions.csv : toutes les transactions DVF 2020-2025
+  - fact_lots.csv         : tous les lots avec surface Carrez
+  - dim_arrondissements.csv
+  - dim_transports.csv
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+WAREHOUSE_DIR = Path(__file__).resolve().parent
+SILVER_DIR = WAREHOUSE_DIR.parents[0] / 'silver'
+GOLD_DIR = WAREHOUSE_DIR.parents[0] / 'gold'
+BRONZE_DIR = WAREHOUSE_DIR.parents[0] / 'bronze'
+
+ANNEES = list(range(2020, 2026))
+
+ORDINAUX = {
+    1: '1er', 2: '2e', 3: '3e', 4: '4e', 5: '5e', 6: '6e', 7: '7e',
+    8: '8e', 9: '9e', 10: '10e', 11: '11e', 12: '12e', 13: '13e',
+    14: '14e', 15: '15e', 16: '16e', 17: '17e', 18: '18e', 19: '19e', 20: '20e',
+}
+
+
+def build_fact_transactions():
+    """Concatene tous les fichiers silver *_clean.csv en une table de faits.
+
+    Ecriture en flux : chaque annee est ajoutee au CSV de sortie des sa
+    lecture (en-tete sur la premiere seulement), au lieu d'accumuler les
+    six DataFrames puis de les recopier dans un pd.concat. La memoire de
+    pointe reste celle d'une seule annee.
+    """
+    print("fact_transactions...")
+    total = 0
+    with open(WAREHOUSE_DIR / 'fact_transactions.csv', 'w', newline='') as sortie:
+        for annee in ANNEES:
+            chemin = SILVER_DIR / f'75_{annee}_clean.csv'
+            df = pd.read_csv(chemin, dtype=str, engine='pyarrow')
+            df['annee_source'] = str(annee)
+            df['fichier_source'] = chemin.name
+            df.to_csv(sortie, index=False, header=(total == 0))
+            total += len(df)
+    print(f"  {total} lignes")
+
+
+def build_fact_lots():
+    """Concatene tous les fichiers silver *_lots.csv en une table de faits.
+
+    Meme ecriture en flux que build_fact_transactions : une annee en
+    memoire a la fois.
+    """
+    print("fact_lots...")
+    total = 0
+    with open(WAREHOUSE_DIR / 'fact_lots.csv', 'w', newline='') as sortie:
+        for annee in ANNEES:
+            df = pd.read_csv(SILVER_DIR / f'75_{annee}_lots.csv',
+                             dtype=str, engine='pyarrow')
+            df['annee_source'] = str(annee)
+            df.to_csv(sortie, index=False, header=(total == 0))
+            total += len(df)
+    print(f"  {total} lignes")
+
+
+def build_dim_arrondissements():
+    """Dimension arrondissements : extrait descriptif de la couche Gold."""
+    print("dim_arrondissements...")
+    df = pd.read_csv(GOLD_DIR / 'dashboard_arrondissements_paris7.csv',
+                     sep=';', engine='pyarrow')
+    dim = df[['Arrondissement', 'nom_arrondissement', 'population_2018',
+              'nb_logements_sociaux_2023', 'taux_logements_sociaux_pct']].copy()
+    dim.to_csv(WAREHOUSE_DIR / 'dim_arrondissements.csv', index=False)
+    print(f"  {len(dim)} lignes")
+
+
+def build_dim_transports():
+    """Dimension transports : stations du reseau ferre situees dans Paris."""
+    print("dim_transports...")
+    df = pd.read_csv(
+        BRONZE_DIR / 'trafic-annuel-entrant-par-station-du-reseau-ferre-2021.csv',
+        sep=';', encoding='utf-8-sig', engine='pyarrow')
+    df = df[df['Arrondissement pour Paris'].notna()].copy()
+    df['arrondissement_numero'] = df['Arrondissement pour Paris'].astype(int)
+    # Derivations vectorisees : concatenation .str et map de table au lieu
+    # d'un f-string Python par ligne.
+    df['code_insee'] = '751' + df['arrondissement_numero'].astype(str).str.zfill(2)
+    df['arrondissement_nom'] = ('Paris ' + df['arrondissement_numero'].map(ORDINAUX)
+                                + ' Arrondissement')
+    dim = df[['Station', 'Réseau', 'Trafic', 'Ville',
+              'arrondissement_numero', 'code_insee', 'arrondissement_nom']]
+    dim.to_csv(WAREHOUSE_DIR / 'dim_transports.csv', index=False)
+    print(f"  {len(dim)} lignes")
+
+
+def main():
+    print("=== Construction de l'entrepot ===")
+    build_fact_transactions()
+    build_fact_lots()
+    build_dim_arrondissements()
+    build_dim_transports()
+    print("Termine.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Normalisation des colonnes numeriques de fact_transactions.csv.
+
+Ajoute pour chaque colonne numerique une version min-max ([0, 1]) et une
+version z-score, utilisables pour des analyses comparatives en aval.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+WAREHOUSE_DIR = Path(__file__).resolve().parent
+
+NUMERIC_COLUMNS = ['valeur_fonciere', 'surface_reelle_bati', 'nombre_pieces_principales']
+
+
+def ajouter_normalisations(df):
+    """Ajoute les colonnes *_minmax et *_zscore en une seule passe.
+
+    Chaque colonne n'est convertie en numerique qu'une fois et ses quatre
+    reductions (min, max, moyenne, ecart-type) sont calculees sur le meme
+    tableau, au lieu de deux to_numeric et quatre balayages separes par
+    colonne. Les deux normalisations partagent ensuite les valeurs
+    converties.
+    """
+    matrice = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce').to_numpy()
+    minimums = np.nanmin(matrice, axis=0)
+    maximums = np.nanmax(matrice, axis=0)
+    moyennes = np.nanmean(matrice, axis=0)
+    # ddof=1 : meme ecart-type echantillon que Series.std().
+    ecarts_types = np.nanstd(matrice, axis=0, ddof=1)
+    for indice, colonne in enumerate(NUMERIC_COLUMNS):
+        valeurs = matrice[:, indice]
+        etendue = maximums[indice] - minimums[indice]
+        minmax = (valeurs - minimums[indice]) / etendue if etendue else valeurs * 0
+        zscore = ((valeurs - moyennes[indice]) / ecarts_types[indice]
+                  if ecarts_types[indice] else valeurs * 0)
+        df[f'{colonne}_minmax'] = np.round(minmax, 6)
+        df[f'{colonne}_zscore'] = np.round(zscore, 6)
+
+
+def main():
+    print("=== Normalisation des transactions ===")
+    df = pd.read_csv(WAREHOUSE_DIR / 'fact_transactions.csv', dtype=str)
+    ajouter_normalisations(df)
+    df.to_csv(WAREHOUSE_DIR / 'fact_transactions_scaled.csv', index=False)
+    print(f"Ecrit : fact_transactions_scaled.csv ({len(df)} lignes)")
+
+
+if __name__ == '__main__':
+    main()